@@ -6,9 +6,7 @@ A library for processing PS5 ELF/SELF files including SDK downgrade, fake signin
 import os
 import sys
 import shutil
-import argparse
 import subprocess
-import tempfile
 import json
 import ctypes
 from pathlib import Path
@@ -18,13 +16,18 @@ from typing import Dict, List, Tuple, Optional, Union, Any
 import os
 import sys
 import shutil
-import argparse
+import stat
 import subprocess
-import tempfile
 import json
+import copy
+import functools
 import ctypes
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union, Any
+from typing import Dict, List, Tuple, Optional, Union, Any, Iterator, BinaryIO, Callable
 
 # =====================================================================
 # CROSS-PLATFORM ENVIRONMENT FIXER (Windows PATH quirk)
@@ -99,18 +102,69 @@ except ImportError:
             "and decrypt_fself.py are available in the src folder."
         )
 
+# Escape codes are only worth writing to a terminal; NO_COLOR (no-color.org) opts out
+USE_ANSI_COLORS = bool(sys.stdout and sys.stdout.isatty()) and not os.environ.get('NO_COLOR')
+
 # ANSI color codes
-GREEN = '\033[92m'
-YELLOW = '\033[93m'
-RED = '\033[91m'
-CYAN = '\033[96m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
-BOLD = '\033[1m'
+if USE_ANSI_COLORS:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    CYAN = '\033[96m'
+    BLUE = '\033[94m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+else:
+    GREEN = YELLOW = RED = CYAN = BLUE = RESET = BOLD = ''
+
+# Rule framing the configuration and summary blocks of the interactive CLI
+SECTION_RULE = f"{BLUE}{BOLD}{'═' * 58}{RESET}"
+
+# Interactive operations and CLI modes that take SDK pair, PAID, PType and fakelib settings
+SIGNING_OPERATIONS = frozenset({'decrypt_and_sign_pipeline', 'downgrade_and_sign'})
+SIGNING_MODES = frozenset({'auto', 'downgrade'})
 
 # Configuration file path
 CONFIG_FILE = "ps5_backport_config.json"
 
+# Directory holding this module, the default project root and fakelib location
+PROJECT_ROOT = Path(__file__).parent
+
+# File magic bytes
+ELF_MAGIC = b'\x7FELF'
+SELF_MAGICS = frozenset({b'\x4F\x15\x3D\x1D', b'\x54\x14\xF5\xEE'})
+MAGIC_KINDS = {ELF_MAGIC: 'elf', **{magic: 'self' for magic in SELF_MAGICS}}
+
+# Data file extensions found in game dumps that are never ELF/SELF, classified without opening
+NON_EXECUTABLE_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.bmp', '.gif', '.dds',
+    '.json', '.xml', '.txt', '.ini', '.cfg', '.html', '.css',
+    '.at9', '.wav', '.mp3', '.ogg', '.mp4', '.webm', '.bik',
+    '.ttf', '.otf',
+})
+
+# Spellings of eboot.bin seen in dumps, matched without lower-casing each walked name
+EBOOT_NAMES = frozenset({'eboot.bin', 'EBOOT.BIN', 'Eboot.bin'})
+
+# ==========================================================================
+# NATIVE SUBSTRING SEARCH
+# Uses the C library's memmem to scan mapped files where it is available.
+# ==========================================================================
+def _load_libc_memmem():
+    """Return the C library's memmem via ctypes, or None if it isn't available."""
+    if sys.platform == 'win32':
+        return None
+    try:
+        memmem = ctypes.CDLL(None).memmem
+    except (OSError, AttributeError, TypeError):
+        return None
+    memmem.restype = ctypes.c_void_p
+    memmem.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_char_p, ctypes.c_size_t]
+    return memmem
+
+LIBC_MEMMEM = _load_libc_memmem()
+# ==========================================================================
+
 
 class PS5ELFProcessor:
     """Main class for PS5 ELF processing operations."""
@@ -119,6 +173,15 @@ class PS5ELFProcessor:
     LIBC_PATCH_PATTERN = b'4h6F1LLbTiw#A#B'
     LIBC_PATCH_REPLACEMENT = b'IWIBBdTHit4#A#B'
     
+    # Maximum number of entries kept in the file type cache
+    CLASSIFY_CACHE_SIZE = 65536
+    
+    # Read size for the chunked pattern scan used when a file can't be memory-mapped
+    SCAN_CHUNK_SIZE = 1024 * 1024
+    
+    # Lines collected by _batched_printer before they are written out
+    PRINT_BATCH_LINES = 64
+    
     def __init__(self, use_colors: bool = True, project_root: Optional[Union[str, Path]] = None):
         """
         Initialize the PS5 ELF processor.
@@ -128,13 +191,26 @@ class PS5ELFProcessor:
             project_root: Root directory of the project (for finding fakelib). 
                          If None, uses directory of this file.
         """
-        # Disable colors automatically if output is redirected to a file
-        if use_colors and not sys.stdout.isatty():
+        # Disable colors automatically if output is redirected to a file or NO_COLOR is set
+        if use_colors and not (USE_ANSI_COLORS and sys.stdout.isatty()):
             self.use_colors = False
         else:
             self.use_colors = use_colors
+        
+        # Bind the print path once so _print doesn't re-check use_colors per call
+        if not self.use_colors:
+            self._print = self._print_plain
             
-        self.project_root = Path(project_root) if project_root else Path(__file__).parent
+        self.project_root = Path(project_root) if project_root else PROJECT_ROOT
+        
+        # SDK pair table is static, so fetch it once per processor
+        self._sdk_pairs = SDKVersionPatcher.get_supported_pairs()
+        
+        # File type cache: path -> (mtime_ns, size, kind), reused across scans of the same tree
+        self._classify_cache = {}
+        
+        # Parsed config file as (mtime_ns, size, config), reused until the file changes
+        self._config_cache = None
     
     def _color(self, text: str, color_code: str) -> str:
         """Apply color to text if colors are enabled."""
@@ -143,49 +219,446 @@ class PS5ELFProcessor:
     def _print(self, message: str, color: Optional[str] = None, bold: bool = False):
         """Print a message with optional color and bold."""
         if color:
-            message = self._color(message, color)
-        if bold and self.use_colors:
+            message = color + message + RESET
+        if bold:
             message = BOLD + message
         print(message)
     
-    def _is_elf_file(self, file_path: Path) -> bool:
-        """Check if a file is an ELF file by checking its magic bytes."""
-        if file_path.name.endswith('.bak'):
-            return False
+    def _print_plain(self, message: str, color: Optional[str] = None, bold: bool = False):
+        """Print a message as-is; used in place of _print when colors are disabled."""
+        print(message)
+    
+    @contextmanager
+    def _batched_printer(self) -> Iterator[Callable[..., None]]:
+        """
+        Yield a print callable with _print's signature that writes in batches of lines.
+        
+        Used around per-file loops so a long run doesn't issue one console write
+        per message. Everything collected is written out when the block exits.
+        """
+        lines = []
+        
+        def flush():
+            if lines:
+                print('\n'.join(lines))
+                lines.clear()
+        
+        def print_batched(message: str, color: Optional[str] = None, bold: bool = False):
+            if self.use_colors:
+                if color:
+                    message = color + message + RESET
+                if bold:
+                    message = BOLD + message
+            lines.append(message)
+            if len(lines) >= self.PRINT_BATCH_LINES:
+                flush()
         
         try:
-            with open(file_path, 'rb') as f:
-                magic = f.read(4)
-                return magic == b'\x7FELF'
-        except:
-            return False
+            yield print_batched
+        finally:
+            flush()
+    
+    def _print_block(
+        self,
+        header: str,
+        header_color: str,
+        lines: List[Tuple[str, Optional[str]]],
+        bold: bool = False
+    ):
+        """
+        Print a header followed by (message, color) lines with a single write.
+        
+        Args:
+            header: First line of the block
+            header_color: Color for the header
+            lines: Remaining lines as (message, color) pairs; a falsy color means no color
+            bold: Whether to make the header bold
+        """
+        if not self.use_colors:
+            print('\n'.join([header] + [message for message, _ in lines]))
+            return
+        
+        block = [(BOLD if bold else '') + header_color + header + RESET]
+        for message, color in lines:
+            block.append(color + message + RESET if color else message)
+        print('\n'.join(block))
+    
+    def _read_magic(self, file_path: Union[str, Path]) -> bytes:
+        """Read the first 4 bytes of a file with a single unbuffered read."""
+        fd = os.open(str(file_path), os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            return os.read(fd, 4)
+        finally:
+            os.close(fd)
+    
+    def _classify_file(self, file_path: Union[str, Path], st: Optional[os.stat_result] = None) -> str:
+        """
+        Classify a file by its magic bytes.
+        
+        Backup files are not filtered here; callers skip .bak names before classifying.
+        Known data extensions are 'other' without touching the file. Other results are
+        cached per path and reused while the file's mtime and size are unchanged.
+        Callers that already stat'ed the file can pass st to skip the stat here.
+        
+        Returns:
+            'elf', 'self', or 'other'
+        """
+        path_str = str(file_path)
+        
+        if os.path.splitext(path_str)[1].lower() in NON_EXECUTABLE_EXTENSIONS:
+            return 'other'
+        
+        try:
+            if st is None:
+                st = os.stat(path_str)
+            cached = self._classify_cache.get(path_str)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+            
+            magic = self._read_magic(path_str)
+        except OSError:
+            return 'other'
+        
+        kind = MAGIC_KINDS.get(magic, 'other')
+        self._cache_kind(path_str, kind, st)
+        
+        return kind
+    
+    def _cache_kind(self, path_str: str, kind: str, st: Optional[os.stat_result] = None):
+        """
+        Store a file's kind in the classification cache.
+        
+        Callers that just wrote a file of known kind (e.g. a signed SELF) record it here,
+        so later walks over the output directory don't reopen it to read its magic.
+        """
+        if st is None:
+            try:
+                st = os.stat(path_str)
+            except OSError:
+                return
+        
+        if len(self._classify_cache) >= self.CLASSIFY_CACHE_SIZE:
+            self._classify_cache.clear()
+        self._classify_cache[path_str] = (st.st_mtime_ns, st.st_size, kind)
+    
+    def _classify_files(self, file_paths: List[str]) -> List[str]:
+        """
+        Classify many files at once, reading their magic bytes concurrently.
+        
+        Args:
+            file_paths: Paths to classify
+            
+        Returns:
+            List of 'elf', 'self', or 'other', in the same order as file_paths
+        """
+        if len(file_paths) < 2:
+            return [self._classify_file(p) for p in file_paths]
+        
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(self._classify_file, file_paths))
     
-    def _is_self_file(self, file_path: Path) -> bool:
+    def _classify_entries(self, entries: List[os.DirEntry]) -> List[str]:
+        """
+        Classify walked files, probing them in inode order.
+        
+        On spinning disks inode order roughly follows on-disk layout, so the magic
+        reads seek less than in directory order. Windows has no cheap inode number
+        on DirEntry, so there the files are probed in walk order.
+        
+        Returns:
+            List of 'elf', 'self', or 'other', in the same order as entries
+        """
+        paths = [entry.path for entry in entries]
+        if os.name == 'nt' or len(entries) < 2:
+            return self._classify_files(paths)
+        
+        order = sorted(range(len(entries)), key=lambda i: entries[i].inode())
+        kinds = [None] * len(entries)
+        for i, kind in zip(order, self._classify_files([paths[i] for i in order])):
+            kinds[i] = kind
+        return kinds
+    
+    def _is_elf_file(self, file_path: Union[str, Path]) -> bool:
+        """Check if a file is an ELF file by checking its magic bytes."""
+        return self._classify_file(file_path) == 'elf'
+    
+    def _is_self_file(self, file_path: Union[str, Path]) -> bool:
         """Check if a file is a SELF file by checking its magic bytes."""
-        if file_path.name.endswith('.bak'):
-            return False
+        return self._classify_file(file_path) == 'self'
+    
+    def _iter_candidate_files(self, root: Union[str, Path], skip_name: Optional[str] = 'decrypted') -> Iterator[os.DirEntry]:
+        """
+        Recursively yield file entries under root using os.scandir.
+        
+        Follows the same order as a top-down os.walk: files of a directory come
+        before its subdirectories. Directories named skip_name (case-insensitive)
+        are pruned, symlinked directories are not followed, and .bak files are
+        skipped. Callers get os.DirEntry objects so a Path is only built for
+        files that are actually kept.
+        
+        Args:
+            root: Directory to search
+            skip_name: Directory name to prune from the walk, or None to prune nothing
+            
+        Yields:
+            os.DirEntry for each candidate file
+        """
+        skip_lower = skip_name.lower() if skip_name is not None else None
+        pending = [os.fspath(root)]
+        
+        while pending:
+            subdirs = []
+            try:
+                with os.scandir(pending.pop()) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        
+                        if is_dir:
+                            if (skip_lower is None or entry.name.lower() != skip_lower) and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif not entry.name.endswith('.bak'):
+                            yield entry
+            except OSError:
+                continue
+            
+            # Visit subdirectories in listing order, like os.walk
+            pending.extend(reversed(subdirs))
+    
+    def _find_libc_patch_targets(self, input_path: Path) -> List[Path]:
+        """
+        Collect SELF files and libc.prx files under a directory in a single walk.
+        
+        Args:
+            input_path: Directory to search recursively
+            
+        Returns:
+            List of candidate files for libc patching, in walk order
+        """
+        # Skip folders named "decrypted"
+        entries = list(self._iter_candidate_files(input_path, 'decrypted'))
+        
+        # libc.prx is a target regardless of its magic, so only sniff the rest
+        is_libc_prx = [e.name.lower() == 'libc.prx' for e in entries]
+        to_classify = [e for e, libc_prx in zip(entries, is_libc_prx) if not libc_prx]
+        kinds = iter(self._classify_entries(to_classify))
+        
+        targets = []
+        for entry, libc_prx in zip(entries, is_libc_prx):
+            if libc_prx or next(kinds) == 'self':
+                targets.append(Path(entry.path))
+        
+        return targets
+    
+    def _relative_str(self, file_path: Union[str, Path], base_prefix: str) -> str:
+        """
+        Return file_path relative to a directory as a string.
+        
+        base_prefix is the directory with a trailing separator (os.path.join(dir, '')),
+        built once per loop so the common case is a string slice instead of Path.relative_to.
+        """
+        path_str = str(file_path)
+        if path_str.startswith(base_prefix):
+            return path_str[len(base_prefix):]
+        return os.path.relpath(path_str, base_prefix)
+    
+    def _existing_files(self, root: Path) -> set:
+        """
+        Collect the files already under root as normcased relative paths, in one walk.
+        
+        Output loops check membership in this set instead of calling exists() per file.
+        Folders named "decrypted" are pruned, as they never hold outputs of the walk's own
+        inputs (the input walks prune them too).
+        """
+        if not root.is_dir():
+            return set()
+        
+        root_prefix = os.path.join(str(root), '')
+        return {
+            os.path.normcase(self._relative_str(entry.path, root_prefix))
+            for entry in self._iter_candidate_files(root, 'decrypted')
+        }
+    
+    def _make_parent_dirs(self, root: Path, relative_paths: List[str]) -> None:
+        """
+        Create the parent directories of relative_paths under root in one pass.
+        
+        Each unique directory is created once before the copy or signing loop
+        starts, so the per-file work no longer touches the directory tree.
+        """
+        for relative_dir in dict.fromkeys(os.path.dirname(p) for p in relative_paths):
+            (root / relative_dir).mkdir(parents=True, exist_ok=True)
+    
+    def _copy_file(self, src: Union[str, Path], dst: Path) -> None:
+        """
+        Copy src to dst with its metadata, keeping the data copy in the kernel.
+        
+        Uses os.copy_file_range where available (reflinked on copy-on-write
+        filesystems), falling back to shutil.copyfile when it is missing or refused.
+        """
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                if remaining == 0:
+                    shutil.copystat(src, dst)
+                    return
+            except OSError:
+                pass
+        
+        shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+    
+    def _scan_file_for_patterns(
+        self,
+        file_path: Path,
+        first_pattern: bytes,
+        second_pattern: bytes,
+        require_first: bool = False
+    ) -> Tuple[bool, bool]:
+        """
+        Look for two byte patterns in a file through a memory map.
+        
+        The file is never copied into memory. Where the C library provides memmem it
+        searches the mapping directly; otherwise mmap.find runs CPython's C fast search.
+        
+        Args:
+            file_path: File to scan
+            first_pattern: Pattern searched first
+            second_pattern: Pattern searched second
+            require_first: Skip the second search (reporting False) when the first
+                           pattern is missing, for callers that don't need it then
+        
+        Returns:
+            Tuple of (first pattern found, second pattern found)
+        """
+        with open(file_path, 'rb') as f:
+            # Empty files can't be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return False, False
+            
+            # ctypes needs a writable buffer to take the mapping's address; a
+            # copy-on-write mapping provides one and is never written to
+            access = mmap.ACCESS_READ if LIBC_MEMMEM is None else mmap.ACCESS_COPY
+            
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=access)
+            except (OSError, ValueError):
+                # Some filesystems and special files can't be mapped
+                return self._scan_stream_for_patterns(f, first_pattern, second_pattern, require_first)
+            
+            with mm:
+                # Files are scanned front to back once, so ask for aggressive readahead
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                
+                buf = None
+                if LIBC_MEMMEM is None:
+                    def contains(pattern: bytes) -> bool:
+                        return mm.find(pattern) != -1
+                else:
+                    buf = ctypes.c_char.from_buffer(mm)
+                    addr = ctypes.addressof(buf)
+                    size = len(mm)
+                    
+                    def contains(pattern: bytes) -> bool:
+                        return LIBC_MEMMEM(addr, size, pattern, len(pattern)) is not None
+                
+                try:
+                    has_first = contains(first_pattern)
+                    if require_first and not has_first:
+                        return False, False
+                    return has_first, contains(second_pattern)
+                finally:
+                    # The mapping can't be closed while ctypes still references it
+                    del buf
+    
+    def _scan_stream_for_patterns(
+        self,
+        f: BinaryIO,
+        first_pattern: bytes,
+        second_pattern: bytes,
+        require_first: bool = False
+    ) -> Tuple[bool, bool]:
+        """
+        Look for two byte patterns by reading a file in fixed-size chunks.
+        
+        Fallback for files that can't be memory-mapped. Each chunk is searched together
+        with the tail of the previous one so matches across chunk boundaries are found,
+        keeping memory use at about SCAN_CHUNK_SIZE regardless of file size.
+        
+        Returns:
+            Tuple of (first pattern found, second pattern found)
+        """
+        overlap = max(len(first_pattern), len(second_pattern)) - 1
+        has_first = False
+        has_second = False
+        tail = b''
+        
+        while True:
+            chunk = f.read(self.SCAN_CHUNK_SIZE)
+            if not chunk:
+                break
+            
+            window = tail + chunk
+            has_first = has_first or first_pattern in window
+            has_second = has_second or second_pattern in window
+            if has_first and has_second:
+                break
+            
+            tail = window[-overlap:] if overlap else b''
+        
+        if require_first and not has_first:
+            return False, False
+        return has_first, has_second
+    
+    def _replace_in_place(self, file_path: Path, search_pattern: bytes, replacement_pattern: bytes) -> bool:
+        """
+        Overwrite every occurrence of a pattern directly in the file through a memory map.
+        Both patterns must have the same length.
+        
+        Returns:
+            True if the search pattern is gone and the replacement is present afterwards
+        """
+        size = len(search_pattern)
+        
+        with open(file_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mm:
+            offset = mm.find(search_pattern)
+            while offset != -1:
+                mm[offset:offset + size] = replacement_pattern
+                offset = mm.find(search_pattern, offset + size)
+            mm.flush()
+            
+            return mm.find(search_pattern) == -1 and mm.find(replacement_pattern) != -1
+    
+    def _write_file_atomic(self, file_path: Path, data: bytes):
+        """Write data to a temporary sibling file, then swap it over the original."""
+        tmp_path = file_path.with_name(file_path.name + '.tmp')
         
         try:
-            with open(file_path, 'rb') as f:
-                magic = f.read(4)
-                return magic in [b'\x4F\x15\x3D\x1D', b'\x54\x14\xF5\xEE']
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            shutil.copymode(file_path, tmp_path)
+            os.replace(tmp_path, file_path)
         except:
-            return False
-    
-    def _should_skip_dir(self, dirs: List[str], skip_name: str = 'decrypted') -> None:
-        """Remove directories with specific names (case-insensitive) from the dirs list to skip them."""
-        dirs_to_remove = [d for d in dirs if d.lower() == skip_name.lower()]
-        for dir_name in dirs_to_remove:
-            dirs.remove(dir_name)
+            if tmp_path.exists():
+                os.remove(tmp_path)
+            raise
     
     def get_supported_sdk_pairs(self) -> Dict[int, Tuple[int, int]]:
         """Get all supported SDK version pairs."""
-        return SDKVersionPatcher.get_supported_pairs()
+        return self._sdk_pairs.copy()
     
     def get_sdk_pair_info(self, sdk_pair: int) -> Optional[Tuple[int, int]]:
         """Get PS5 and PS4 SDK versions for a specific pair."""
-        pairs = self.get_supported_sdk_pairs()
-        return pairs.get(sdk_pair)
+        return self._sdk_pairs.get(sdk_pair)
     
     def parse_ptype(self, ptype_str: str) -> int:
         """Parse program type from string (e.g., 'fake', 'npdrm_exec')."""
@@ -197,7 +670,8 @@ class PS5ELFProcessor:
         output_dir: Union[str, Path],
         overwrite: bool = False,
         verbose: bool = True,
-        save_to_config: bool = True
+        save_to_config: bool = True,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Decrypt SELF files back to ELF files.
@@ -208,6 +682,7 @@ class PS5ELFProcessor:
             overwrite: Overwrite existing files
             verbose: Print progress information
             save_to_config: Whether to save directories to config file (default: True)
+            max_workers: Maximum number of files decrypted concurrently (default: ThreadPoolExecutor default)
             
         Returns:
             Dictionary with processing results
@@ -215,9 +690,14 @@ class PS5ELFProcessor:
         input_dir = Path(input_dir)
         output_dir = Path(output_dir)
         
-        # Save directories to config only if requested
+        # Save directories to config only if requested, overlapping the write with the scan
+        config_saver = None
         if save_to_config:
-            self._save_directories_to_config(str(input_dir), str(output_dir))
+            config_saver = threading.Thread(
+                target=self._save_directories_to_config,
+                args=(str(input_dir), str(output_dir))
+            )
+            config_saver.start()
         
         results = {
             'operation': 'decrypt',
@@ -235,22 +715,18 @@ class PS5ELFProcessor:
             self._print(f"Output: {output_dir}", CYAN)
         
         # Find all SELF files in input directory
-        self_files = []
-        for root, dirs, files in os.walk(input_dir):
-            # Skip folders named "decrypted"
-            self._should_skip_dir(dirs, 'decrypted')
-            
-            for filename in files:
-                file_path = Path(root) / filename
-                if filename.endswith('.bak'):
-                    continue
-                if self._is_self_file(file_path):
-                    self_files.append(file_path)
+        # Skip folders named "decrypted"
+        entries = list(self._iter_candidate_files(input_dir, 'decrypted'))
+        candidates = [e.path for e in entries]
+        kinds = self._classify_entries(entries)
+        self_files = [p for p, kind in zip(candidates, kinds) if kind == 'self']
         
         if not self_files:
             if verbose:
                 self._print(f"No SELF files found in input directory", YELLOW)
-            return results
+            if config_saver:
+                config_saver.join()
+            return self._set_failed_total(results)
         
         if verbose:
             self._print(f"Found {len(self_files)} SELF file(s) to decrypt", CYAN)
@@ -261,70 +737,322 @@ class PS5ELFProcessor:
         # Initialize converter
         converter = UnsignedELFConverter(verbose=verbose)
         
-        for self_file in self_files:
-            relative_path = self_file.relative_to(input_dir)
-            
+        input_prefix = os.path.join(str(input_dir), '')
+        
+        jobs = []
+        relative_paths = [self._relative_str(self_file, input_prefix) for self_file in self_files]
+        self._make_parent_dirs(output_dir, relative_paths)
+        existing_outputs = self._existing_files(output_dir) if not overwrite else set()
+        for self_file, relative_path in zip(self_files, relative_paths):
             # Output file keeps same name and extension
             output_file = output_dir / relative_path
             
-            # Create parent directories if they don't exist
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
             # Check if file exists and skip if not overwriting
-            if output_file.exists() and not overwrite:
+            if os.path.normcase(relative_path) in existing_outputs:
                 if verbose:
                     self._print(f"Skipping (exists): {relative_path}", YELLOW)
                 continue
             
-            if verbose:
-                self._print(f"Decrypting: {relative_path}", None)
-            
-            # Decrypt the file
-            try:
-                success = converter.convert_file(str(self_file), str(output_file))
-                
-                file_result = {
-                    'success': success,
-                    'output': str(output_file),
-                    'message': 'Success' if success else 'Failed'
-                }
+            jobs.append((self_file, relative_path, output_file))
+        
+        def decrypt_one(job: Tuple[str, str, Path]) -> Tuple[Dict[str, Any], List[str]]:
+            self_file, _, output_file = job
+            return self._decrypt_one(converter, self_file, output_file)
+        
+        # Files are independent, so decrypt them concurrently and report in input order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for (self_file, relative_path, _), (file_result, log_lines) in zip(jobs, executor.map(decrypt_one, jobs)):
+                results['files'][self_file] = file_result
                 
-                results['files'][str(self_file)] = file_result
+                if verbose:
+                    self._print(f"Decrypting: {relative_path}", None)
+                if log_lines:
+                    self._print('\n'.join(log_lines))
                 
-                if success:
+                if file_result['success']:
                     results['successful'] += 1
                     if verbose:
                         self._print(f"  ✓ Success", GREEN)
                 else:
                     results['failed'] += 1
                     if verbose:
-                        self._print(f"  ✗ Failed", RED)
-                        
-            except Exception as e:
-                results['failed'] += 1
-                error_msg = f"Error: {str(e)}"
-                file_result = {
-                    'success': False,
-                    'output': str(output_file),
-                    'message': error_msg
-                }
-                results['files'][str(self_file)] = file_result
-                if verbose:
-                    self._print(f"  ✗ {error_msg[:50]}", RED)
+                        self._print(f"  ✗ {file_result['message'][:50]}", RED)
         
         if verbose:
             self._print(f"\nDecryption complete: {results['successful']} successful, "
                        f"{results['failed']} failed", CYAN)
         
+        if config_saver:
+            config_saver.join()
+        
+        return self._set_failed_total(results)
+    
+    def _decrypt_one(
+        self, converter: UnsignedELFConverter, self_file: Union[str, Path], output_file: Path
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Decrypt a single SELF file and return its result entry.
+        
+        The converter's output lines are collected instead of printed, so callers
+        running this on worker threads can print them in input order.
+        """
+        output_str = str(output_file)
+        log_lines = []
+        
+        try:
+            success = converter.convert_file(str(self_file), output_str, log=log_lines.append)
+            
+            return {
+                'success': success,
+                'output': output_str,
+                'message': 'Success' if success else 'Failed'
+            }, log_lines
+        
+        except Exception as e:
+            return {
+                'success': False,
+                'output': output_str,
+                'message': f"Error: {str(e)}"
+            }, log_lines
+    
+    def _set_failed_total(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record the failures of all steps as results['failed_total'].
+        
+        Sums the top-level 'failed' count of decrypt_files and the per-step counts of
+        the signing pipelines, so callers check a single field. A file that fails more
+        than one step is counted once per step.
+        """
+        results['failed_total'] = results.get('failed', 0) + sum(
+            results[key]['failed'] for key in ('decrypt', 'downgrade', 'signing') if key in results
+        )
         return results
     
+    def _downgrade_one(self, sdk_patcher: SDKVersionPatcher, input_file: str) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Downgrade a single ELF file and return its result entry.
+        
+        The patcher's progress lines are collected instead of printed, so callers
+        running this on worker threads can print them in input order.
+        """
+        log_lines = []
+        try:
+            success, message = sdk_patcher.patch_file(input_file, log=log_lines.append)
+            return {'success': success, 'message': message}, log_lines
+        
+        except Exception as e:
+            return {'success': False, 'message': f"Error: {str(e)}"}, log_lines
+    
+    def _downgrade_and_sign_files(
+        self,
+        records: List[Tuple[str, str]],
+        sdk_patcher: SDKVersionPatcher,
+        converter: FakeSignedELFConverter,
+        output_dir: Path,
+        overwrite: bool,
+        results: Dict[str, Any],
+        verbose: bool,
+        max_workers: Optional[int],
+        sign_step: str
+    ):
+        """
+        Downgrade and fake sign (input path, relative path) records into output_dir.
+        
+        Each file is downgraded and signed by a single worker task, so a file is signed
+        as soon as its own downgrade finishes while it is still in the page cache.
+        Outcomes are recorded in results and reported in input order.
+        
+        Args:
+            records: (input path, path relative to output_dir) pairs
+            sdk_patcher: Patcher configured with the target SDK versions
+            converter: Converter configured with the signing parameters
+            output_dir: Directory receiving the signed files
+            overwrite: Re-sign files whose output already exists
+            results: Pipeline results, filled under 'downgrade' and 'signing'
+            verbose: Print progress information
+            max_workers: Maximum number of files processed concurrently
+            sign_step: Step label for the signing header, e.g. "[Step 2/4]"
+        """
+        self._make_parent_dirs(output_dir, [relative_path for _, relative_path in records])
+        existing_outputs = self._existing_files(output_dir) if not overwrite else set()
+        
+        # Output checks are resolved once per run, so the per-file task only carries the work
+        def process_one(record: Tuple[str, str]) -> Tuple[Dict[str, Any], List[str], Any]:
+            input_file, relative_path = record
+            downgrade_result, log_lines = self._downgrade_one(sdk_patcher, input_file)
+            if not downgrade_result['success']:
+                return downgrade_result, log_lines, 'downgrade_failed'
+            
+            output_file = output_dir / relative_path
+            if os.path.normcase(relative_path) in existing_outputs:
+                return downgrade_result, log_lines, 'exists'
+            
+            return downgrade_result, log_lines, self._sign_one(converter, input_file, str(output_file))
+        
+        sign_plan = []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, self._batched_printer() as emit:
+            for (input_file_str, relative_path), (file_result, log_lines, outcome) in zip(
+                records, executor.map(process_one, records)
+            ):
+                if verbose:
+                    emit(f"Downgrading: {relative_path}", None)
+                if log_lines:
+                    emit('\n'.join(log_lines))
+                
+                results['downgrade']['files'][input_file_str] = file_result
+                
+                if file_result['success']:
+                    results['downgrade']['successful'] += 1
+                    if verbose:
+                        emit(f"  ✓ Success", GREEN)
+                else:
+                    results['downgrade']['failed'] += 1
+                    if verbose:
+                        emit(f"  ✗ {file_result['message'][:50]}", RED)
+                
+                sign_plan.append((input_file_str, relative_path, outcome))
+            
+            if verbose:
+                emit(f"\nDowngrade complete: {results['downgrade']['successful']} successful, "
+                     f"{results['downgrade']['failed']} failed", CYAN)
+            
+            if verbose:
+                emit(f"\n{sign_step} Fake Signing Files (ELF → SELF)", BLUE, bold=True)
+                emit(f"Using PAID: 0x{converter.paid:016X}, PType: 0x{converter.ptype:08X}", CYAN)
+            
+            for input_file_str, relative_path, outcome in sign_plan:
+                if outcome == 'downgrade_failed':
+                    if verbose:
+                        emit(f"Skipping (downgrade failed): {relative_path}", YELLOW)
+                    results['signing']['files'][input_file_str] = {
+                        'success': False,
+                        'output': '',
+                        'message': 'Skipped due to downgrade failure'
+                    }
+                    results['signing']['failed'] += 1
+                    continue
+                
+                if outcome == 'exists':
+                    if verbose:
+                        emit(f"Skipping (exists): {relative_path}", YELLOW)
+                    continue
+                
+                results['signing']['files'][input_file_str] = outcome
+                
+                if verbose:
+                    emit(f"Signing: {relative_path}", None)
+                
+                if outcome['success']:
+                    results['signing']['successful'] += 1
+                    self._cache_kind(outcome['output'], 'self')
+                    if verbose:
+                        emit(f"  ✓ Success (converted to SELF)", GREEN)
+                else:
+                    results['signing']['failed'] += 1
+                    if verbose:
+                        emit(f"  ✗ {outcome['message'][:50]}", RED)
+        
+        if verbose:
+            self._print(f"\nSigning complete: {results['signing']['successful']} successful, "
+                       f"{results['signing']['failed']} failed", CYAN)
+            self._print(f"All ELF files have been converted to SELF format", CYAN)
+    
+    def _sign_one(self, converter: FakeSignedELFConverter, input_file: str, output_file: str) -> Dict[str, Any]:
+        """
+        Fake sign a single ELF file and return its result entry.
+        
+        The SELF is written to a temporary sibling and moved into place only on success,
+        so an interrupted or failed signing never leaves a partial output behind that a
+        later run would skip as already existing.
+        """
+        tmp_file = output_file + '.tmp'
+        
+        try:
+            success = converter.sign_file(input_file, tmp_file)
+            if success:
+                os.replace(tmp_file, output_file)
+            
+            return {
+                'success': success,
+                'output': output_file,
+                'message': 'Success' if success else 'Failed'
+            }
+        
+        except Exception as e:
+            return {
+                'success': False,
+                'output': output_file,
+                'message': f"Error: {str(e)}"
+            }
+        
+        finally:
+            if os.path.exists(tmp_file):
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+    
+    def _sign_single(
+        self,
+        input_file: str,
+        output_file: str,
+        sdk_pair: int,
+        paid: int,
+        ptype: int,
+        log: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Downgrade and fake sign a single ELF file straight to output_file.
+        
+        The downgrade patches in place, so it runs on a scratch copy beside the output
+        instead of input_file. No temporary directory or directory walk is involved.
+        The patcher's per-segment messages go to log, or are dropped when it is None.
+        """
+        # Stat first so a missing input still raises FileNotFoundError
+        if self._classify_file(input_file, os.stat(input_file)) != 'elf':
+            return {'success': False, 'output': '', 'message': 'Not an ELF file'}
+        
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        scratch_file = output_file + '.elf.tmp'
+        
+        try:
+            shutil.copyfile(input_file, scratch_file)
+            
+            sdk_patcher = SDKVersionPatcher(create_backup=False, use_colors=self.use_colors)
+            sdk_patcher.set_versions_by_pair(sdk_pair)
+            # Report the patch against input_file rather than the scratch copy
+            success, message = sdk_patcher.patch_file(
+                scratch_file,
+                log=(lambda message: log(message.replace(scratch_file, input_file))) if log else (lambda message: None)
+            )
+            if not success:
+                return {'success': False, 'output': '', 'message': message}
+            
+            converter = FakeSignedELFConverter(
+                paid=paid,
+                ptype=ptype,
+                app_version=0,
+                fw_version=0,
+                auth_info=None
+            )
+            return self._sign_one(converter, scratch_file, output_file)
+        
+        finally:
+            if os.path.exists(scratch_file):
+                try:
+                    os.remove(scratch_file)
+                except OSError:
+                    pass
+    
     def apply_libc_patch(
         self,
         input_dir: Union[str, Path],
         search_pattern: bytes = None,
         replacement_pattern: bytes = None,
         create_backup: bool = True,
-        verbose: bool = True
+        verbose: bool = True,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Apply the libc.prx patch to SELF files in the directory or a single file.
@@ -335,11 +1063,13 @@ class PS5ELFProcessor:
             replacement_pattern: Bytes pattern to replace with (defaults to LIBC_PATCH_REPLACEMENT)
             create_backup: Create backup files before patching
             verbose: Print progress information
+            max_workers: Maximum number of files processed concurrently (default: ThreadPoolExecutor default)
             
         Returns:
             Dictionary with patching results
         """
         input_path = Path(input_dir)
+        is_file_input = input_path.is_file()
         
         if search_pattern is None:
             search_pattern = self.LIBC_PATCH_PATTERN
@@ -349,7 +1079,7 @@ class PS5ELFProcessor:
         results = {
             'operation': 'apply_libc_patch',
             'input_path': str(input_path),
-            'is_file': input_path.is_file(),
+            'is_file': is_file_input,
             'search_pattern': search_pattern.hex(),
             'replacement_pattern': replacement_pattern.hex(),
             'applied': 0,
@@ -362,7 +1092,7 @@ class PS5ELFProcessor:
         
         if verbose:
             self._print(f"\n[Libc Patch] Applying libc.prx patch", BLUE, bold=True)
-            if input_path.is_file():
+            if is_file_input:
                 self._print(f"Input file: {input_path}", CYAN)
             else:
                 self._print(f"Input directory: {input_path}", CYAN)
@@ -372,178 +1102,60 @@ class PS5ELFProcessor:
         # Collect files to patch
         files_to_patch = []
         
-        if input_path.is_file():
+        if is_file_input:
             # Single file input
-            if self._is_self_file(input_path) or 'libc' in input_path.name.lower():
+            is_backup = input_path.name.endswith('.bak')
+            if 'libc' in input_path.name.lower() or (not is_backup and self._is_self_file(input_path)):
                 files_to_patch.append(input_path)
             elif verbose:
                 self._print(f"Warning: Input file may not be a SELF or libc file", YELLOW)
                 files_to_patch.append(input_path)  # Try anyway
         else:
             # Directory input - search recursively
-            for root, dirs, files in os.walk(input_path):
-                # Skip folders named "decrypted"
-                self._should_skip_dir(dirs, 'decrypted')
-                
-                for filename in files:
-                    file_path = Path(root) / filename
-                    if filename.endswith('.bak'):
-                        continue
-                    if self._is_self_file(file_path):
-                        files_to_patch.append(file_path)
-            
-            # Also search for libc.prx files specifically
-            for root, dirs, files in os.walk(input_path):
-                # Skip folders named "decrypted"
-                self._should_skip_dir(dirs, 'decrypted')
-                
-                for filename in files:
-                    file_path = Path(root) / filename
-                    if filename.lower() == 'libc.prx' and file_path not in files_to_patch:
-                        files_to_patch.append(file_path)
+            files_to_patch = self._find_libc_patch_targets(input_path)
         
         if not files_to_patch:
             if verbose:
-                if input_path.is_file():
+                if is_file_input:
                     self._print(f"Input file is not a recognized SELF or libc file", YELLOW)
                 else:
                     self._print(f"No SELF files found in input directory", YELLOW)
             return results
         
         if verbose:
-            if input_path.is_file():
+            if is_file_input:
                 self._print(f"Checking 1 file", CYAN)
             else:
                 self._print(f"Found {len(files_to_patch)} file(s) to check for libc patch", CYAN)
         
-        for file_path in files_to_patch:
-            # For single file input, show just filename. For directory input, show relative path
-            if input_path.is_file():
-                display_path = file_path.name
-            else:
-                relative_path = file_path.relative_to(input_path)
-                display_path = str(relative_path)
-            
-            if verbose:
-                self._print(f"Checking: {display_path}", None)
+        def patch_one(file_path: Path) -> Tuple[str, Dict[str, Any], str, str]:
+            return self._apply_libc_patch_to_file(
+                file_path, search_pattern, replacement_pattern, create_backup
+            )
+        
+        input_prefix = os.path.join(str(input_path), '')
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(patch_one, files_to_patch)
             
-            try:
-                # Read file content
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                
-                # Check if pattern exists
-                if search_pattern in content:
-                    # Check if already has replacement pattern
-                    if replacement_pattern in content:
-                        results['already_patched'] += 1
-                        results['files'][str(file_path)] = {
-                            'status': 'already_patched',
-                            'message': 'File already contains replacement pattern'
-                        }
-                        if verbose:
-                            self._print(f"  ⚠ Already patched", YELLOW)
-                        continue
-                    
-                    # Create backup if requested
-                    backup_path = None
-                    if create_backup:
-                        backup_path = file_path.with_suffix('.bak')
-                        shutil.copy2(file_path, backup_path)
-                    
-                    try:
-                        # Apply patch
-                        patched_content = content.replace(search_pattern, replacement_pattern)
-                        
-                        # Write patched content
-                        with open(file_path, 'wb') as f:
-                            f.write(patched_content)
-                        
-                        # Verify patch
-                        with open(file_path, 'rb') as f:
-                            new_content = f.read()
-                        
-                        if search_pattern not in new_content and replacement_pattern in new_content:
-                            results['applied'] += 1
-                            file_result = {
-                                'status': 'applied',
-                                'backup': str(backup_path) if backup_path else None,
-                                'message': 'Patch applied successfully'
-                            }
-                            results['files'][str(file_path)] = file_result
-                            
-                            if verbose:
-                                self._print(f"  ✓ Patch applied", GREEN)
-                        else:
-                            # Restore from backup if exists
-                            if backup_path and backup_path.exists():
-                                shutil.copy2(backup_path, file_path)
-                            
-                            results['failed'] += 1
-                            file_result = {
-                                'status': 'failed',
-                                'message': 'Patch verification failed'
-                            }
-                            results['files'][str(file_path)] = file_result
-                            
-                            if verbose:
-                                self._print(f"  ✗ Patch verification failed", RED)
-                        
-                        # Clean up backup if successful
-                        if backup_path and backup_path.exists():
-                            try:
-                                os.remove(backup_path)
-                                if 'backup' in file_result:
-                                    file_result['backup_cleaned'] = True
-                            except:
-                                pass
-                        
-                    except Exception as e:
-                        # Restore from backup on error
-                        if backup_path and backup_path.exists():
-                            shutil.copy2(backup_path, file_path)
-                        
-                        results['failed'] += 1
-                        file_result = {
-                            'status': 'error',
-                            'message': f"Error during patching: {str(e)}"
-                        }
-                        results['files'][str(file_path)] = file_result
-                        
-                        if verbose:
-                            self._print(f"  ✗ Error: {str(e)[:50]}", RED)
-                
-                else:
-                    # Pattern not found in this file
-                    results['pattern_not_found'] += 1
-                    results['files'][str(file_path)] = {
-                        'status': 'pattern_not_found',
-                        'message': 'Search pattern not found in file'
-                    }
-                    
-                    if 'libc' in file_path.name.lower():
-                        if verbose:
-                            self._print(f"  ⚠ Pattern not found in libc file", YELLOW)
-                    elif verbose:
-                        self._print(f"  Pattern not found", CYAN)
-                    
-            except Exception as e:
-                results['failed'] += 1
-                file_result = {
-                    'status': 'error',
-                    'message': f"Error reading file: {str(e)}"
-                }
+            for file_path, (counter, file_result, message, color) in zip(files_to_patch, outcomes):
+                results[counter] += 1
                 results['files'][str(file_path)] = file_result
                 
                 if verbose:
-                    self._print(f"  ✗ Error reading file: {str(e)[:50]}", RED)
+                    # For single file input, show just filename. For directory input, show relative path
+                    display_path = file_path.name if is_file_input else self._relative_str(file_path, input_prefix)
+                    
+                    self._print(f"Checking: {display_path}", None)
+                    self._print(message, color)
         
         if verbose:
-            self._print(f"\nLibc patch complete:", CYAN)
-            self._print(f"  Applied: {results['applied']}", GREEN)
-            self._print(f"  Already patched: {results['already_patched']}", YELLOW)
-            self._print(f"  Pattern not found: {results['pattern_not_found']}")
-            self._print(f"  Failed: {results['failed']}", RED if results['failed'] > 0 else "")
+            self._print_block(f"\nLibc patch complete:", CYAN, [
+                (f"  Applied: {results['applied']}", GREEN),
+                (f"  Already patched: {results['already_patched']}", YELLOW),
+                (f"  Pattern not found: {results['pattern_not_found']}", None),
+                (f"  Failed: {results['failed']}", RED if results['failed'] > 0 else ""),
+            ])
         
         return results
     
@@ -553,7 +1165,8 @@ class PS5ELFProcessor:
         search_pattern: bytes = None,
         original_pattern: bytes = None,
         create_backup: bool = True,
-        verbose: bool = True
+        verbose: bool = True,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Revert the libc.prx patch from SELF files in the directory or a single file.
@@ -565,11 +1178,13 @@ class PS5ELFProcessor:
             original_pattern: Bytes pattern to restore (defaults to LIBC_PATCH_PATTERN)
             create_backup: Create backup files before reverting
             verbose: Print progress information
+            max_workers: Maximum number of files processed concurrently (default: ThreadPoolExecutor default)
             
         Returns:
             Dictionary with reversion results
         """
         input_path = Path(input_dir)
+        is_file_input = input_path.is_file()
         
         if search_pattern is None:
             search_pattern = self.LIBC_PATCH_REPLACEMENT
@@ -579,7 +1194,7 @@ class PS5ELFProcessor:
         results = {
             'operation': 'revert_libc_patch',
             'input_path': str(input_path),
-            'is_file': input_path.is_file(),
+            'is_file': is_file_input,
             'search_pattern': search_pattern.hex(),
             'original_pattern': original_pattern.hex(),
             'reverted': 0,
@@ -592,7 +1207,7 @@ class PS5ELFProcessor:
         
         if verbose:
             self._print(f"\n[Libc Patch] Reverting libc.prx patch", BLUE, bold=True)
-            if input_path.is_file():
+            if is_file_input:
                 self._print(f"Input file: {input_path}", CYAN)
             else:
                 self._print(f"Input directory: {input_path}", CYAN)
@@ -603,186 +1218,280 @@ class PS5ELFProcessor:
         # Collect files to revert
         files_to_revert = []
         
-        if input_path.is_file():
+        if is_file_input:
             # Single file input
-            if self._is_self_file(input_path) or 'libc' in input_path.name.lower():
+            is_backup = input_path.name.endswith('.bak')
+            if 'libc' in input_path.name.lower() or (not is_backup and self._is_self_file(input_path)):
                 files_to_revert.append(input_path)
             elif verbose:
                 self._print(f"Warning: Input file may not be a SELF or libc file", YELLOW)
                 files_to_revert.append(input_path)  # Try anyway
         else:
             # Directory input - search recursively
-            for root, dirs, files in os.walk(input_path):
-                # Skip folders named "decrypted"
-                self._should_skip_dir(dirs, 'decrypted')
-                
-                for filename in files:
-                    file_path = Path(root) / filename
-                    if filename.endswith('.bak'):
-                        continue
-                    if self._is_self_file(file_path):
-                        files_to_revert.append(file_path)
-            
-            # Also search for libc.prx files specifically
-            for root, dirs, files in os.walk(input_path):
-                # Skip folders named "decrypted"
-                self._should_skip_dir(dirs, 'decrypted')
-                
-                for filename in files:
-                    file_path = Path(root) / filename
-                    if filename.lower() == 'libc.prx' and file_path not in files_to_revert:
-                        files_to_revert.append(file_path)
+            files_to_revert = self._find_libc_patch_targets(input_path)
         
         if not files_to_revert:
             if verbose:
-                if input_path.is_file():
+                if is_file_input:
                     self._print(f"Input file is not a recognized SELF or libc file", YELLOW)
                 else:
                     self._print(f"No SELF files found in input directory", YELLOW)
             return results
         
         if verbose:
-            if input_path.is_file():
+            if is_file_input:
                 self._print(f"Checking 1 file", CYAN)
             else:
                 self._print(f"Found {len(files_to_revert)} file(s) to check for libc patch reversion", CYAN)
         
-        for file_path in files_to_revert:
-            # For single file input, show just filename. For directory input, show relative path
-            if input_path.is_file():
-                display_path = file_path.name
-            else:
-                relative_path = file_path.relative_to(input_path)
-                display_path = str(relative_path)
+        def revert_one(file_path: Path) -> Tuple[str, Dict[str, Any], str, str]:
+            return self._revert_libc_patch_in_file(
+                file_path, search_pattern, original_pattern, create_backup
+            )
+        
+        input_prefix = os.path.join(str(input_path), '')
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(revert_one, files_to_revert)
             
-            if verbose:
-                self._print(f"Checking: {display_path}", None)
+            for file_path, (counter, file_result, message, color) in zip(files_to_revert, outcomes):
+                results[counter] += 1
+                results['files'][str(file_path)] = file_result
+                
+                if verbose:
+                    # For single file input, show just filename. For directory input, show relative path
+                    display_path = file_path.name if is_file_input else self._relative_str(file_path, input_prefix)
+                    
+                    self._print(f"Checking: {display_path}", None)
+                    self._print(message, color)
+        
+        if verbose:
+            self._print_block(f"\nLibc patch reversion complete:", CYAN, [
+                (f"  Reverted: {results['reverted']}", GREEN),
+                (f"  Already original: {results['already_original']}", YELLOW),
+                (f"  Patch not found: {results['patch_not_found']}", None),
+                (f"  Failed: {results['failed']}", RED if results['failed'] > 0 else ""),
+            ])
+        
+        return results
+    
+    def _apply_libc_patch_to_file(
+        self,
+        file_path: Path,
+        search_pattern: bytes,
+        replacement_pattern: bytes,
+        create_backup: bool
+    ) -> Tuple[str, Dict[str, Any], str, str]:
+        """
+        Apply the libc.prx patch to a single file.
+        
+        Returns:
+            Tuple of (results counter to increment, file result, console message, console color)
+        """
+        try:
+            # Check both patterns without reading the file into memory
+            has_search, has_replacement = self._scan_file_for_patterns(
+                file_path, search_pattern, replacement_pattern, require_first=True
+            )
+            
+            if not has_search:
+                # Pattern not found in this file
+                file_result = {
+                    'status': 'pattern_not_found',
+                    'message': 'Search pattern not found in file'
+                }
+                if 'libc' in file_path.name.lower():
+                    return 'pattern_not_found', file_result, "  ⚠ Pattern not found in libc file", YELLOW
+                return 'pattern_not_found', file_result, "  Pattern not found", CYAN
+            
+            # Check if already has replacement pattern
+            if has_replacement:
+                file_result = {
+                    'status': 'already_patched',
+                    'message': 'File already contains replacement pattern'
+                }
+                return 'already_patched', file_result, "  ⚠ Already patched", YELLOW
+            
+            # Create backup if requested
+            backup_path = None
+            backup_created = False
+            if create_backup:
+                backup_path = file_path.with_name(file_path.name + '.bak')
+                shutil.copyfile(file_path, backup_path)
+                backup_created = True
             
             try:
-                # Read file content
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                
-                # Check if patch pattern exists
-                if search_pattern in content:
-                    # Check if already has original pattern (already reverted)
-                    if original_pattern in content:
-                        results['already_original'] += 1
-                        results['files'][str(file_path)] = {
-                            'status': 'already_original',
-                            'message': 'File already contains original pattern'
-                        }
-                        if verbose:
-                            self._print(f"  ⚠ Already original", YELLOW)
-                        continue
+                # Apply patch
+                if len(search_pattern) == len(replacement_pattern):
+                    verified = self._replace_in_place(file_path, search_pattern, replacement_pattern)
+                else:
+                    patched_content = file_path.read_bytes().replace(search_pattern, replacement_pattern)
                     
-                    # Create backup if requested
-                    backup_path = None
-                    if create_backup:
-                        backup_path = file_path.with_suffix('.revert_bak')
-                        shutil.copy2(file_path, backup_path)
+                    # Verify patch before writing it out
+                    verified = search_pattern not in patched_content and replacement_pattern in patched_content
+                    if verified:
+                        self._write_file_atomic(file_path, patched_content)
+                
+                if verified:
+                    file_result = {
+                        'status': 'applied',
+                        'backup': str(backup_path) if backup_path else None,
+                        'message': 'Patch applied successfully'
+                    }
+                    outcome = ('applied', file_result, "  ✓ Patch applied", GREEN)
+                else:
+                    # Restore from backup if exists
+                    if backup_created:
+                        shutil.copy2(backup_path, file_path)
                     
+                    file_result = {
+                        'status': 'failed',
+                        'message': 'Patch verification failed'
+                    }
+                    outcome = ('failed', file_result, "  ✗ Patch verification failed", RED)
+                
+                # Clean up backup if successful
+                if backup_created:
                     try:
-                        # Revert patch
-                        reverted_content = content.replace(search_pattern, original_pattern)
-                        
-                        # Write reverted content
-                        with open(file_path, 'wb') as f:
-                            f.write(reverted_content)
-                        
-                        # Verify reversion
-                        with open(file_path, 'rb') as f:
-                            new_content = f.read()
-                        
-                        if original_pattern in new_content and search_pattern not in new_content:
-                            results['reverted'] += 1
-                            file_result = {
-                                'status': 'reverted',
-                                'backup': str(backup_path) if backup_path else None,
-                                'message': 'Patch reverted successfully'
-                            }
-                            results['files'][str(file_path)] = file_result
-                            
-                            if verbose:
-                                self._print(f"  ✓ Patch reverted", GREEN)
-                        else:
-                            # Restore from backup if exists
-                            if backup_path and backup_path.exists():
-                                shutil.copy2(backup_path, file_path)
-                            
-                            results['failed'] += 1
-                            file_result = {
-                                'status': 'failed',
-                                'message': 'Reversion verification failed'
-                            }
-                            results['files'][str(file_path)] = file_result
-                            
-                            if verbose:
-                                self._print(f"  ✗ Reversion verification failed", RED)
-                        
-                        # Clean up backup if successful
-                        if backup_path and backup_path.exists():
-                            try:
-                                os.remove(backup_path)
-                                if 'backup' in file_result:
-                                    file_result['backup_cleaned'] = True
-                            except:
-                                pass
-                        
-                    except Exception as e:
-                        # Restore from backup on error
-                        if backup_path and backup_path.exists():
-                            shutil.copy2(backup_path, file_path)
-                        
-                        results['failed'] += 1
-                        file_result = {
-                            'status': 'error',
-                            'message': f"Error during reversion: {str(e)}"
-                        }
-                        results['files'][str(file_path)] = file_result
-                        
-                        if verbose:
-                            self._print(f"  ✗ Error: {str(e)[:50]}", RED)
+                        os.remove(backup_path)
+                        backup_created = False
+                        if 'backup' in file_result:
+                            file_result['backup_cleaned'] = True
+                    except:
+                        pass
                 
+                return outcome
+            
+            except Exception as e:
+                # Restore from backup on error
+                if backup_created:
+                    shutil.copy2(backup_path, file_path)
+                
+                file_result = {
+                    'status': 'error',
+                    'message': f"Error during patching: {str(e)}"
+                }
+                return 'failed', file_result, f"  ✗ Error: {str(e)[:50]}", RED
+        
+        except Exception as e:
+            file_result = {
+                'status': 'error',
+                'message': f"Error reading file: {str(e)}"
+            }
+            return 'failed', file_result, f"  ✗ Error reading file: {str(e)[:50]}", RED
+    
+    def _revert_libc_patch_in_file(
+        self,
+        file_path: Path,
+        search_pattern: bytes,
+        original_pattern: bytes,
+        create_backup: bool
+    ) -> Tuple[str, Dict[str, Any], str, str]:
+        """
+        Revert the libc.prx patch in a single file.
+        
+        Returns:
+            Tuple of (results counter to increment, file result, console message, console color)
+        """
+        try:
+            # Check both patterns without reading the file into memory
+            has_search, has_original = self._scan_file_for_patterns(
+                file_path, search_pattern, original_pattern, require_first=True
+            )
+            
+            if not has_search:
+                # Patch pattern not found in this file
+                file_result = {
+                    'status': 'patch_not_found',
+                    'message': 'Patch pattern not found in file'
+                }
+                if 'libc' in file_path.name.lower():
+                    return 'patch_not_found', file_result, "  ⚠ Patch pattern not found in libc file", YELLOW
+                return 'patch_not_found', file_result, "  Patch pattern not found", CYAN
+            
+            # Check if already has original pattern (already reverted)
+            if has_original:
+                file_result = {
+                    'status': 'already_original',
+                    'message': 'File already contains original pattern'
+                }
+                return 'already_original', file_result, "  ⚠ Already original", YELLOW
+            
+            # Create backup if requested
+            backup_path = None
+            backup_created = False
+            if create_backup:
+                backup_path = file_path.with_name(file_path.name + '.revert_bak')
+                shutil.copyfile(file_path, backup_path)
+                backup_created = True
+            
+            try:
+                # Revert patch
+                if len(search_pattern) == len(original_pattern):
+                    verified = self._replace_in_place(file_path, search_pattern, original_pattern)
                 else:
-                    # Patch pattern not found in this file
-                    results['patch_not_found'] += 1
-                    results['files'][str(file_path)] = {
-                        'status': 'patch_not_found',
-                        'message': 'Patch pattern not found in file'
-                    }
+                    reverted_content = file_path.read_bytes().replace(search_pattern, original_pattern)
                     
-                    if verbose and 'libc' in file_path.name.lower():
-                        self._print(f"  ⚠ Patch pattern not found in libc file", YELLOW)
-                    elif verbose:
-                        self._print(f"  Patch pattern not found", CYAN)
+                    # Verify reversion before writing it out
+                    verified = original_pattern in reverted_content and search_pattern not in reverted_content
+                    if verified:
+                        self._write_file_atomic(file_path, reverted_content)
+                
+                if verified:
+                    file_result = {
+                        'status': 'reverted',
+                        'backup': str(backup_path) if backup_path else None,
+                        'message': 'Patch reverted successfully'
+                    }
+                    outcome = ('reverted', file_result, "  ✓ Patch reverted", GREEN)
+                else:
+                    # Restore from backup if exists
+                    if backup_created:
+                        shutil.copy2(backup_path, file_path)
                     
+                    file_result = {
+                        'status': 'failed',
+                        'message': 'Reversion verification failed'
+                    }
+                    outcome = ('failed', file_result, "  ✗ Reversion verification failed", RED)
+                
+                # Clean up backup if successful
+                if backup_created:
+                    try:
+                        os.remove(backup_path)
+                        backup_created = False
+                        if 'backup' in file_result:
+                            file_result['backup_cleaned'] = True
+                    except:
+                        pass
+                
+                return outcome
+            
             except Exception as e:
-                results['failed'] += 1
+                # Restore from backup on error
+                if backup_created:
+                    shutil.copy2(backup_path, file_path)
+                
                 file_result = {
                     'status': 'error',
-                    'message': f"Error reading file: {str(e)}"
+                    'message': f"Error during reversion: {str(e)}"
                 }
-                results['files'][str(file_path)] = file_result
-                
-                if verbose:
-                    self._print(f"  ✗ Error reading file: {str(e)[:50]}", RED)
-        
-        if verbose:
-            self._print(f"\nLibc patch reversion complete:", CYAN)
-            self._print(f"  Reverted: {results['reverted']}", GREEN)
-            self._print(f"  Already original: {results['already_original']}", YELLOW)
-            self._print(f"  Patch not found: {results['patch_not_found']}")
-            self._print(f"  Failed: {results['failed']}", RED if results['failed'] > 0 else "")
+                return 'failed', file_result, f"  ✗ Error: {str(e)[:50]}", RED
         
-        return results
+        except Exception as e:
+            file_result = {
+                'status': 'error',
+                'message': f"Error reading file: {str(e)}"
+            }
+            return 'failed', file_result, f"  ✗ Error reading file: {str(e)[:50]}", RED
     
     def check_libc_patch_status(
         self,
         input_path: Union[str, Path],
         search_pattern: bytes = None,
         patch_pattern: bytes = None,
-        verbose: bool = True
+        verbose: bool = True,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Check the status of libc.prx patches in SELF files or a single file.
@@ -792,11 +1501,13 @@ class PS5ELFProcessor:
             search_pattern: Original bytes pattern (defaults to LIBC_PATCH_PATTERN)
             patch_pattern: Patch bytes pattern (defaults to LIBC_PATCH_REPLACEMENT)
             verbose: Print progress information
+            max_workers: Maximum number of files scanned concurrently (default: ThreadPoolExecutor default)
             
         Returns:
             Dictionary with patch status information
         """
         input_path = Path(input_path)
+        is_file_input = input_path.is_file()
         
         if search_pattern is None:
             search_pattern = self.LIBC_PATCH_PATTERN
@@ -806,7 +1517,7 @@ class PS5ELFProcessor:
         results = {
             'operation': 'check_libc_patch_status',
             'input_path': str(input_path),
-            'is_file_input': input_path.is_file(),
+            'is_file_input': is_file_input,
             'original_pattern': search_pattern.hex(),
             'patch_pattern': patch_pattern.hex(),
             'original_files': [],
@@ -820,7 +1531,7 @@ class PS5ELFProcessor:
         
         if verbose:
             self._print(f"\n[Libc Patch] Checking libc.prx patch status", BLUE, bold=True)
-            if input_path.is_file():
+            if is_file_input:
                 self._print(f"Input: Single file: {input_path}", CYAN)
             else:
                 self._print(f"Input: Directory: {input_path}", CYAN)
@@ -828,39 +1539,21 @@ class PS5ELFProcessor:
         # Collect files to check
         self_files = []
         
-        if input_path.is_file():
+        if is_file_input:
             # Single file input
-            if self._is_self_file(input_path) or 'libc' in input_path.name.lower():
+            is_backup = input_path.name.endswith('.bak')
+            if 'libc' in input_path.name.lower() or (not is_backup and self._is_self_file(input_path)):
                 self_files.append(input_path)
             elif verbose:
                 self._print(f"Input file may not be a recognized SELF or libc file", YELLOW)
                 self_files.append(input_path)  # Try to check anyway
         else:
-            # Directory input - search recursively
-            for root, dirs, files in os.walk(input_path):
-                # Skip folders named "decrypted"
-                self._should_skip_dir(dirs, 'decrypted')
-                
-                for filename in files:
-                    file_path = Path(root) / filename
-                    if filename.endswith('.bak'):
-                        continue
-                    if self._is_self_file(file_path):
-                        self_files.append(file_path)
-            
-            # Also search for libc.prx files specifically
-            for root, dirs, files in os.walk(input_path):
-                # Skip folders named "decrypted"
-                self._should_skip_dir(dirs, 'decrypted')
-                
-                for filename in files:
-                    file_path = Path(root) / filename
-                    if filename.lower() == 'libc.prx' and file_path not in self_files:
-                        self_files.append(file_path)
+            # Directory input - SELF files and libc.prx files in a single walk
+            self_files = self._find_libc_patch_targets(input_path)
         
         if not self_files:
             if verbose:
-                if input_path.is_file():
+                if is_file_input:
                     self._print(f"Input file is not a valid SELF or libc file", YELLOW)
                 else:
                     self._print(f"No SELF files found in input directory", YELLOW)
@@ -869,38 +1562,55 @@ class PS5ELFProcessor:
         results['total_files'] = len(self_files)
         
         if verbose:
-            if input_path.is_file():
+            if is_file_input:
                 self._print(f"Checking 1 file", CYAN)
             else:
                 self._print(f"Found {len(self_files)} file(s) to check", CYAN)
         
-        for file_path in self_files:
-            # For single file input, show just filename. For directory input, show relative path
-            if input_path.is_file():
-                display_path = file_path.name
-                relative_path = file_path  # Use full path for single file
-            else:
-                relative_path = file_path.relative_to(input_path)
-                display_path = str(relative_path)
-            
+        def scan_one(file_path: Path) -> Tuple[Optional[Tuple[bool, bool]], Optional[Exception]]:
             try:
-                # Read file content
-                with open(file_path, 'rb') as f:
-                    content = f.read()
+                return self._scan_file_for_patterns(file_path, search_pattern, patch_pattern), None
+            except Exception as e:
+                return None, e
+        
+        input_prefix = os.path.join(str(input_path), '')
+        
+        # Scan files concurrently, then record and report them in input order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_path, (found, error) in zip(self_files, executor.map(scan_one, self_files)):
+                # Relative path is only recorded for directory inputs
+                if not is_file_input:
+                    relative_path = self._relative_str(file_path, input_prefix)
+                
+                if error is not None:
+                    error_info = {
+                        'path': str(file_path),
+                        'error': str(error)
+                    }
+                    # Add relative path only for directory inputs
+                    if not is_file_input:
+                        error_info['relative_path'] = relative_path
+                    
+                    results['error_files'].append(error_info)
+                    
+                    if verbose:
+                        display_path = file_path.name if is_file_input else relative_path
+                        self._print(f"{display_path}: Error reading file", RED)
+                    continue
                 
-                has_original = search_pattern in content
-                has_patch = patch_pattern in content
+                has_original, has_patch = found
+                is_libc = 'libc' in file_path.name.lower()
                 
                 file_info = {
                     'path': str(file_path),
                     'has_original': has_original,
                     'has_patch': has_patch,
-                    'is_libc_file': 'libc' in file_path.name.lower()
+                    'is_libc_file': is_libc
                 }
                 
                 # Add relative path only for directory inputs
-                if not input_path.is_file():
-                    file_info['relative_path'] = str(relative_path)
+                if not is_file_input:
+                    file_info['relative_path'] = relative_path
                 
                 if has_original and not has_patch:
                     results['original_files'].append(file_info)
@@ -920,33 +1630,20 @@ class PS5ELFProcessor:
                     color = CYAN
                 
                 if verbose:
-                    status_display = f"{display_path}"
-                    if 'libc' in file_path.name.lower():
-                        status_display += " [libc]"
-                    self._print(f"{status_display}: {status}", color)
-                
-            except Exception as e:
-                error_info = {
-                    'path': str(file_path),
-                    'error': str(e)
-                }
-                # Add relative path only for directory inputs
-                if not input_path.is_file():
-                    error_info['relative_path'] = str(relative_path)
-                
-                results['error_files'].append(error_info)
-                
-                if verbose:
-                    self._print(f"{display_path}: Error reading file", RED)
+                    # For single file input, show just filename. For directory input, show relative path
+                    display_path = file_path.name if is_file_input else relative_path
+                    libc_tag = " [libc]" if is_libc else ""
+                    self._print(f"{display_path}{libc_tag}: {status}", color)
         
         if verbose:
-            self._print(f"\nPatch status summary:", BLUE, bold=True)
-            self._print(f"  Original files (not patched): {len(results['original_files'])}", GREEN)
-            self._print(f"  Patched files: {len(results['patched_files'])}", YELLOW)
-            self._print(f"  Both patterns (error): {len(results['both_patterns_files'])}", RED)
-            self._print(f"  No patterns: {len(results['no_pattern_files'])}", CYAN)
-            self._print(f"  Error reading: {len(results['error_files'])}", RED)
-            self._print(f"  Total files: {results['total_files']}")
+            self._print_block(f"\nPatch status summary:", BLUE, [
+                (f"  Original files (not patched): {len(results['original_files'])}", GREEN),
+                (f"  Patched files: {len(results['patched_files'])}", YELLOW),
+                (f"  Both patterns (error): {len(results['both_patterns_files'])}", RED),
+                (f"  No patterns: {len(results['no_pattern_files'])}", CYAN),
+                (f"  Error reading: {len(results['error_files'])}", RED),
+                (f"  Total files: {results['total_files']}", None),
+            ], bold=True)
         
         return results
     
@@ -1008,14 +1705,17 @@ class PS5ELFProcessor:
         apply_libc_patch: bool = True,
         auto_revert_for_high_sdk: bool = True,
         verbose: bool = True,
-        save_to_config: bool = True
+        save_to_config: bool = True,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Process files through downgrade and signing pipeline.
         IMPORTANT: libc.prx patch is applied AFTER signing to the SELF files.
+        Files are downgraded and signed concurrently on up to max_workers threads (default: ThreadPoolExecutor default).
         """
         input_dir = Path(input_dir)
         output_dir = Path(output_dir)
+        input_prefix = os.path.join(str(input_dir), '')
         
         if save_to_config:
             self._save_directories_to_config(str(input_dir), str(output_dir))
@@ -1055,68 +1755,21 @@ class PS5ELFProcessor:
             if sdk_pair <= 6:
                 self._print(f"SDK pair {sdk_pair} selected - will apply libc.prx patch AFTER signing", YELLOW)
             elif auto_revert_for_high_sdk:
-                self._print(f"SDK pair {sdk_pair} > 6 - will revert libc.prx patch AFTER signing if found", YELLOW)
-        
-        elf_files = []
-        for root, dirs, files in os.walk(input_dir):
-            self._should_skip_dir(dirs, 'decrypted')
-            
-            for filename in files:
-                file_path = Path(root) / filename
-                if filename.endswith('.bak'):
-                    continue
-                if self._is_elf_file(file_path):
-                    elf_files.append(file_path)
+                self._print(f"SDK pair {sdk_pair} > 6 - will revert libc.prx patch AFTER signing if found", YELLOW)
+        
+        entries = list(self._iter_candidate_files(input_dir, 'decrypted'))
+        candidates = [e.path for e in entries]
+        kinds = self._classify_entries(entries)
+        elf_files = [p for p, kind in zip(candidates, kinds) if kind == 'elf']
         
         if not elf_files:
             if verbose:
                 self._print(f"No ELF files found in input directory", YELLOW)
-            return results
+            return self._set_failed_total(results)
         
         if verbose:
             self._print(f"Found {len(elf_files)} ELF file(s) to process", CYAN)
         
-        for elf_file in elf_files:
-            relative_path = elf_file.relative_to(input_dir)
-            
-            if verbose:
-                self._print(f"Downgrading: {relative_path}", None)
-            
-            try:
-                success, message = sdk_patcher.patch_file(str(elf_file))
-                
-                results['downgrade']['files'][str(elf_file)] = {
-                    'success': success,
-                    'message': message
-                }
-                
-                if success:
-                    results['downgrade']['successful'] += 1
-                    if verbose:
-                        self._print(f"  ✓ Success", GREEN)
-                else:
-                    results['downgrade']['failed'] += 1
-                    if verbose:
-                        self._print(f"  ✗ {message[:50]}", RED)
-                        
-            except Exception as e:
-                results['downgrade']['failed'] += 1
-                error_msg = f"Error: {str(e)}"
-                results['downgrade']['files'][str(elf_file)] = {
-                    'success': False,
-                    'message': error_msg
-                }
-                if verbose:
-                    self._print(f"  ✗ {error_msg[:50]}", RED)
-        
-        if verbose:
-            self._print(f"\nDowngrade complete: {results['downgrade']['successful']} successful, "
-                       f"{results['downgrade']['failed']} failed", CYAN)
-        
-        if verbose:
-            self._print(f"\n[Step 2/4] Fake Signing Files (ELF → SELF)", BLUE, bold=True)
-            self._print(f"Using PAID: 0x{paid:016X}, PType: 0x{ptype:08X}", CYAN)
-        
         output_dir.mkdir(parents=True, exist_ok=True)
         
         converter = FakeSignedELFConverter(
@@ -1127,65 +1780,11 @@ class PS5ELFProcessor:
             auth_info=None
         )
         
-        for elf_file in elf_files:
-            relative_path = elf_file.relative_to(input_dir)
-            input_file_str = str(elf_file)
-            
-            if not results['downgrade']['files'].get(input_file_str, {}).get('success', False):
-                if verbose:
-                    self._print(f"Skipping (downgrade failed): {relative_path}", YELLOW)
-                results['signing']['files'][str(elf_file)] = {
-                    'success': False,
-                    'output': '',
-                    'message': 'Skipped due to downgrade failure'
-                }
-                results['signing']['failed'] += 1
-                continue
-            
-            output_file = output_dir / relative_path
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            if output_file.exists() and not overwrite:
-                if verbose:
-                    self._print(f"Skipping (exists): {relative_path}", YELLOW)
-                continue
-            
-            if verbose:
-                self._print(f"Signing: {relative_path}", None)
-            
-            try:
-                success = converter.sign_file(input_file_str, str(output_file))
-                
-                results['signing']['files'][str(elf_file)] = {
-                    'success': success,
-                    'output': str(output_file),
-                    'message': 'Success' if success else 'Failed'
-                }
-                
-                if success:
-                    results['signing']['successful'] += 1
-                    if verbose:
-                        self._print(f"  ✓ Success (converted to SELF)", GREEN)
-                else:
-                    results['signing']['failed'] += 1
-                    if verbose:
-                        self._print(f"  ✗ Failed", RED)
-                        
-            except Exception as e:
-                results['signing']['failed'] += 1
-                error_msg = f"Error: {str(e)}"
-                results['signing']['files'][str(elf_file)] = {
-                    'success': False,
-                    'output': str(output_file),
-                    'message': error_msg
-                }
-                if verbose:
-                    self._print(f"  ✗ {error_msg[:50]}", RED)
-        
-        if verbose:
-            self._print(f"\nSigning complete: {results['signing']['successful']} successful, "
-                       f"{results['signing']['failed']} failed", CYAN)
-            self._print(f"All ELF files have been converted to SELF format", CYAN)
+        records = [(path, self._relative_str(path, input_prefix)) for path in elf_files]
+        self._downgrade_and_sign_files(
+            records, sdk_patcher, converter, output_dir, overwrite,
+            results, verbose, max_workers, "[Step 2/4]"
+        )
         
         if apply_libc_patch:
             if sdk_pair <= 6:
@@ -1237,7 +1836,7 @@ class PS5ELFProcessor:
                 if verbose and fakelib_copies['created'] > 0:
                     self._print(f"✓ Created {fakelib_copies['created']} fakelib copy(ies) in eboot.bin directories", GREEN)
         
-        return results
+        return self._set_failed_total(results)
     
     def decrypt_and_sign_pipeline(
         self,
@@ -1252,16 +1851,19 @@ class PS5ELFProcessor:
         apply_libc_patch: bool = True,
         auto_revert_for_high_sdk: bool = True,
         verbose: bool = True,
-        save_to_config: bool = True
+        save_to_config: bool = True,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Process files through a combined pipeline that automatically detects file types.
         If files are SELF: decrypt → save to decrypted folder → downgrade → sign
         If files are ELF: downgrade → sign directly
         libc.prx patch is applied AFTER signing to the SELF files.
+        max_workers caps how many files are processed concurrently.
         """
         input_dir = Path(input_dir)
         output_dir = Path(output_dir)
+        input_prefix = os.path.join(str(input_dir), '')
         
         if save_to_config:
             self._save_directories_to_config(str(input_dir), str(output_dir))
@@ -1289,25 +1891,27 @@ class PS5ELFProcessor:
             self._print(f"Input: {input_dir}", CYAN)
             self._print(f"Output: {output_dir}", CYAN)
         
+        # (path, path relative to input_dir) pairs, reused by every later step
         self_files = []
         elf_files = []
-        
-        for root, dirs, files in os.walk(input_dir):
-            self._should_skip_dir(dirs, 'decrypted')
-            
-            for filename in files:
-                file_path = Path(root) / filename
-                if filename.endswith('.bak'):
-                    continue
-                
-                if self._is_self_file(file_path):
-                    self_files.append(file_path)
-                    results['detection']['self_files'] += 1
-                elif self._is_elf_file(file_path):
-                    elf_files.append(file_path)
-                    results['detection']['elf_files'] += 1
-                else:
-                    results['detection']['other_files'] += 1
+        detected_relative = []
+        
+        entries = list(self._iter_candidate_files(input_dir, 'decrypted'))
+        candidates = [e.path for e in entries]
+        
+        for candidate, kind in zip(candidates, self._classify_entries(entries)):
+            if kind == 'self':
+                relative_path = self._relative_str(candidate, input_prefix)
+                self_files.append((candidate, relative_path))
+                detected_relative.append(relative_path)
+                results['detection']['self_files'] += 1
+            elif kind == 'elf':
+                relative_path = self._relative_str(candidate, input_prefix)
+                elf_files.append((candidate, relative_path))
+                detected_relative.append(relative_path)
+                results['detection']['elf_files'] += 1
+            else:
+                results['detection']['other_files'] += 1
         
         if verbose:
             self._print(f"Found: {len(self_files)} SELF file(s), {len(elf_files)} ELF file(s), "
@@ -1316,7 +1920,7 @@ class PS5ELFProcessor:
         if not self_files and not elf_files:
             if verbose:
                 self._print(f"No SELF or ELF files found in input directory", YELLOW)
-            return results
+            return self._set_failed_total(results)
         
         output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -1333,12 +1937,15 @@ class PS5ELFProcessor:
             
             converter = UnsignedELFConverter(verbose=verbose)
             
-            for self_file in self_files:
-                relative_path = self_file.relative_to(input_dir)
+            # Also used by step 3, whose destinations never collide with decrypted outputs
+            existing_decrypted = self._existing_files(decrypt_output_dir) if not overwrite else set()
+            self._make_parent_dirs(decrypt_output_dir, [relative_path for _, relative_path in self_files])
+            
+            for input_file_str, relative_path in self_files:
                 output_file = decrypt_output_dir / relative_path
-                output_file.parent.mkdir(parents=True, exist_ok=True)
+                output_file_str = str(output_file)
                 
-                if output_file.exists() and not overwrite:
+                if os.path.normcase(relative_path) in existing_decrypted:
                     if verbose:
                         self._print(f"Skipping (exists): {relative_path}", YELLOW)
                     continue
@@ -1347,15 +1954,15 @@ class PS5ELFProcessor:
                     self._print(f"Decrypting: {relative_path}", None)
                 
                 try:
-                    success = converter.convert_file(str(self_file), str(output_file))
+                    success = converter.convert_file(input_file_str, output_file_str)
                     
                     file_result = {
                         'success': success,
-                        'output': str(output_file),
+                        'output': output_file_str,
                         'message': 'Success' if success else 'Failed'
                     }
                     
-                    results['decrypt']['files'][str(self_file)] = file_result
+                    results['decrypt']['files'][input_file_str] = file_result
                     
                     if success:
                         results['decrypt']['successful'] += 1
@@ -1371,10 +1978,10 @@ class PS5ELFProcessor:
                     error_msg = f"Error: {str(e)}"
                     file_result = {
                         'success': False,
-                        'output': str(output_file),
+                        'output': output_file_str,
                         'message': error_msg
                     }
-                    results['decrypt']['files'][str(self_file)] = file_result
+                    results['decrypt']['files'][input_file_str] = file_result
                     if verbose:
                         self._print(f"  ✗ {error_msg[:50]}", RED)
             
@@ -1391,13 +1998,12 @@ class PS5ELFProcessor:
             if verbose:
                 self._print(f"\n[Step 3/5] Copying existing ELF files to working directory", BLUE, bold=True)
             
-            for elf_file in elf_files:
-                relative_path = elf_file.relative_to(input_dir)
+            self._make_parent_dirs(working_dir, [relative_path for _, relative_path in elf_files])
+            for elf_file, relative_path in elf_files:
                 dest_file = working_dir / relative_path
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
                 
-                if not dest_file.exists() or overwrite:
-                    shutil.copy2(elf_file, dest_file)
+                if os.path.normcase(relative_path) not in existing_decrypted:
+                    self._copy_file(elf_file, dest_file)
                     if verbose:
                         self._print(f"Copied: {relative_path}", CYAN)
         
@@ -1422,66 +2028,25 @@ class PS5ELFProcessor:
             elif auto_revert_for_high_sdk:
                 self._print(f"SDK pair {sdk_pair} > 6 - will revert libc.prx patch AFTER signing if found", YELLOW)
         
-        elf_files_to_process = []
-        for root, dirs, files in os.walk(working_dir):
-            self._should_skip_dir(dirs, 'decrypted')
-            
-            for filename in files:
-                file_path = Path(root) / filename
-                if filename.endswith('.bak'):
-                    continue
-                if self._is_elf_file(file_path):
-                    elf_files_to_process.append(file_path)
+        if self_files:
+            # Decrypted and copied files mirror the input layout, so map the
+            # step 1 detections into the working directory instead of walking it
+            candidates = [os.path.join(str(working_dir), rel) for rel in detected_relative]
+            kinds = self._classify_files(candidates)
+            elf_files_to_process = [
+                (path, rel) for path, rel, kind in zip(candidates, detected_relative, kinds) if kind == 'elf'
+            ]
+        else:
+            elf_files_to_process = elf_files
         
         if not elf_files_to_process:
             if verbose:
                 self._print(f"No ELF files found to downgrade", YELLOW)
-            return results
+            return self._set_failed_total(results)
         
         if verbose:
             self._print(f"Found {len(elf_files_to_process)} ELF file(s) to downgrade", CYAN)
         
-        for elf_file in elf_files_to_process:
-            relative_path = elf_file.relative_to(working_dir)
-            
-            if verbose:
-                self._print(f"Downgrading: {relative_path}", None)
-            
-            try:
-                success, message = sdk_patcher.patch_file(str(elf_file))
-                
-                results['downgrade']['files'][str(elf_file)] = {
-                    'success': success,
-                    'message': message
-                }
-                
-                if success:
-                    results['downgrade']['successful'] += 1
-                    if verbose:
-                        self._print(f"  ✓ Success", GREEN)
-                else:
-                    results['downgrade']['failed'] += 1
-                    if verbose:
-                        self._print(f"  ✗ {message[:50]}", RED)
-                    
-            except Exception as e:
-                results['downgrade']['failed'] += 1
-                error_msg = f"Error: {str(e)}"
-                results['downgrade']['files'][str(elf_file)] = {
-                    'success': False,
-                    'message': error_msg
-                }
-                if verbose:
-                    self._print(f"  ✗ {error_msg[:50]}", RED)
-        
-        if verbose:
-            self._print(f"\nDowngrade complete: {results['downgrade']['successful']} successful, "
-                       f"{results['downgrade']['failed']} failed", CYAN)
-        
-        if verbose:
-            self._print(f"\n[Step 5/5] Fake Signing Files (ELF → SELF)", BLUE, bold=True)
-            self._print(f"Using PAID: 0x{paid:016X}, PType: 0x{ptype:08X}", CYAN)
-        
         converter = FakeSignedELFConverter(
             paid=paid,
             ptype=ptype,
@@ -1490,65 +2055,10 @@ class PS5ELFProcessor:
             auth_info=None
         )
         
-        for elf_file in elf_files_to_process:
-            relative_path = elf_file.relative_to(working_dir)
-            input_file_str = str(elf_file)
-            
-            if not results['downgrade']['files'].get(input_file_str, {}).get('success', False):
-                if verbose:
-                    self._print(f"Skipping (downgrade failed): {relative_path}", YELLOW)
-                results['signing']['files'][str(elf_file)] = {
-                    'success': False,
-                    'output': '',
-                    'message': 'Skipped due to downgrade failure'
-                }
-                results['signing']['failed'] += 1
-                continue
-            
-            output_file = output_dir / relative_path
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            if output_file.exists() and not overwrite:
-                if verbose:
-                    self._print(f"Skipping (exists): {relative_path}", YELLOW)
-                continue
-            
-            if verbose:
-                self._print(f"Signing: {relative_path}", None)
-            
-            try:
-                success = converter.sign_file(input_file_str, str(output_file))
-                
-                results['signing']['files'][str(elf_file)] = {
-                    'success': success,
-                    'output': str(output_file),
-                    'message': 'Success' if success else 'Failed'
-                }
-                
-                if success:
-                    results['signing']['successful'] += 1
-                    if verbose:
-                        self._print(f"  ✓ Success (converted to SELF)", GREEN)
-                else:
-                    results['signing']['failed'] += 1
-                    if verbose:
-                        self._print(f"  ✗ Failed", RED)
-                    
-            except Exception as e:
-                results['signing']['failed'] += 1
-                error_msg = f"Error: {str(e)}"
-                results['signing']['files'][str(elf_file)] = {
-                    'success': False,
-                    'output': str(output_file),
-                    'message': error_msg
-                }
-                if verbose:
-                    self._print(f"  ✗ {error_msg[:50]}", RED)
-        
-        if verbose:
-            self._print(f"\nSigning complete: {results['signing']['successful']} successful, "
-                       f"{results['signing']['failed']} failed", CYAN)
-            self._print(f"All ELF files have been converted to SELF format", CYAN)
+        self._downgrade_and_sign_files(
+            elf_files_to_process, sdk_patcher, converter, output_dir, overwrite,
+            results, verbose, max_workers, "[Step 5/5]"
+        )
         
         if apply_libc_patch:
             if sdk_pair <= 6:
@@ -1600,7 +2110,7 @@ class PS5ELFProcessor:
                 if verbose and fakelib_copies['created'] > 0:
                     self._print(f"✓ Created {fakelib_copies['created']} fakelib copy(ies) in eboot.bin directories", GREEN)
         
-        return results
+        return self._set_failed_total(results)
     
     def _copy_fakelib(self, fakelib_source: Path, output_dir: Path) -> Tuple[bool, str]:
         """Copy the fakelib directory to the output directory."""
@@ -1616,14 +2126,57 @@ class PS5ELFProcessor:
             if fakelib_dest.exists():
                 shutil.rmtree(fakelib_dest)
             
-            shutil.copytree(fakelib_source, fakelib_dest)
+            # Count files as they are copied rather than walking the copy afterwards
+            file_count = 0
+            
+            def copy_counted(src: str, dst: str) -> str:
+                nonlocal file_count
+                file_count += 1
+                return shutil.copy2(src, dst)
+            
+            shutil.copytree(fakelib_source, fakelib_dest, copy_function=copy_counted)
             
-            file_count = sum(1 for _ in fakelib_dest.rglob('*') if _.is_file())
             return True, f"Copied fakelib directory from {fakelib_source} ({file_count} files)"
         
         except Exception as e:
             return False, f"Failed to copy fakelib: {str(e)}"
     
+    def _list_tree(self, root: Path) -> Tuple[List[str], List[str]]:
+        """
+        List a directory tree once as (directories, files) relative to root.
+        
+        Directories are listed before anything inside them, so the listing can be
+        replayed into another location with _replicate_tree.
+        """
+        root_prefix = os.path.join(str(root), '')
+        dirs = []
+        files = []
+        
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel_dir = dirpath[len(root_prefix):] if dirpath.startswith(root_prefix) else ''
+            dirs.extend(os.path.join(rel_dir, name) for name in dirnames)
+            files.extend(os.path.join(rel_dir, name) for name in filenames)
+        
+        return dirs, files
+    
+    def _replicate_tree(
+        self,
+        src_root: Path,
+        listing: Tuple[List[str], List[str]],
+        dest_root: Path,
+        copy_function: Callable[[str, str], Any]
+    ):
+        """Recreate a tree listed by _list_tree under dest_root, copying files with copy_function."""
+        dirs, files = listing
+        src_root = str(src_root)
+        dest_root = str(dest_root)
+        
+        os.makedirs(dest_root)
+        for rel_dir in dirs:
+            os.mkdir(os.path.join(dest_root, rel_dir))
+        for rel_file in files:
+            copy_function(os.path.join(src_root, rel_file), os.path.join(dest_root, rel_file))
+    
     def _copy_fakelib_to_eboot_dirs(self, fakelib_source: Path, output_dir: Path, verbose: bool = True) -> Dict[str, Any]:
         """Copy fakelib directory to directories containing eboot.bin files."""
         if not fakelib_source.exists() or not fakelib_source.is_dir():
@@ -1634,12 +2187,11 @@ class PS5ELFProcessor:
             'locations': []
         }
         
-        eboot_files = []
-        for root, dirs, files in os.walk(output_dir):
-            for filename in files:
-                if filename.lower() == 'eboot.bin':
-                    file_path = Path(root) / filename
-                    eboot_files.append(file_path)
+        eboot_files = [
+            Path(entry.path) for entry in self._iter_candidate_files(output_dir, None)
+            if entry.name in EBOOT_NAMES
+            or (len(entry.name) == 9 and entry.name.lower() == 'eboot.bin')
+        ]
         
         if not eboot_files:
             if verbose:
@@ -1649,29 +2201,41 @@ class PS5ELFProcessor:
         if verbose:
             self._print(f"Found {len(eboot_files)} eboot.bin file(s)", CYAN)
         
-        for eboot_file in eboot_files:
-            eboot_dir = eboot_file.parent
-            
-            if eboot_dir == output_dir:
-                continue
-            
+        # Walk the fakelib tree once and replay the listing for every destination.
+        # Files are copied, not hardlinked: libc patching edits them in place.
+        listing = self._list_tree(fakelib_source)
+        
+        # One destination per directory, so concurrent copies never share a target
+        eboot_dirs = list(dict.fromkeys(
+            eboot_file.parent for eboot_file in eboot_files if eboot_file.parent != output_dir
+        ))
+        
+        def copy_one(eboot_dir: Path) -> Optional[Exception]:
             fakelib_dest = eboot_dir / "fakelib"
-            
             try:
                 if fakelib_dest.exists():
                     shutil.rmtree(fakelib_dest)
                 
-                shutil.copytree(fakelib_source, fakelib_dest)
+                self._replicate_tree(fakelib_source, listing, fakelib_dest, shutil.copy2)
+                return None
+            except Exception as e:
+                return e
+        
+        # Copy concurrently, then record and report destinations in walk order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for eboot_dir, error in zip(eboot_dirs, executor.map(copy_one, eboot_dirs)):
+                fakelib_dest = eboot_dir / "fakelib"
+                
+                if error is not None:
+                    if verbose:
+                        self._print(f"  ✗ Failed to copy fakelib to {eboot_dir.relative_to(output_dir)}: {str(error)[:50]}", RED)
+                    continue
                 
                 results['created'] += 1
                 results['locations'].append(str(fakelib_dest))
                 
                 if verbose:
                     self._print(f"  ✓ Copied fakelib to: {fakelib_dest.relative_to(output_dir)}", GREEN)
-                    
-            except Exception as e:
-                if verbose:
-                    self._print(f"  ✗ Failed to copy fakelib to {eboot_dir.relative_to(output_dir)}: {str(e)[:50]}", RED)
         
         return results
     
@@ -1688,13 +2252,29 @@ class PS5ELFProcessor:
         self._save_config(config)
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file."""
+        """
+        Load configuration from file.
+        
+        The parsed config is cached and reused while the file's mtime and size are
+        unchanged, so repeated lookups don't re-read and re-parse it.
+        """
         config_path = self.project_root / CONFIG_FILE
         
-        if config_path.exists():
+        try:
+            st = os.stat(config_path)
+        except OSError:
+            st = None
+        
+        if st is not None:
+            cached = self._config_cache
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return copy.deepcopy(cached[2])
+            
             try:
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    config = json.load(f)
+                self._config_cache = (st.st_mtime_ns, st.st_size, config)
+                return copy.deepcopy(config)
             except:
                 pass
         
@@ -1713,6 +2293,8 @@ class PS5ELFProcessor:
         try:
             with open(config_path, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2)
+            st = os.stat(config_path)
+            self._config_cache = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
         except:
             pass
     
@@ -2015,11 +2597,21 @@ def get_output_directory_with_memory(processor: PS5ELFProcessor) -> Path:
         except Exception as e:
             print(f"{RED}Error creating output directory: {str(e)}{RESET}")
 
+def _iter_failed_files(results: Dict[str, Dict[str, Any]]) -> Iterator[Tuple[str, str, str]]:
+    """Yield (file, operation, message) for each failed file, in summary order."""
+    for key, op in (('decrypt', 'Decryption'), ('downgrade', 'Downgrade'), ('signing', 'Signing')):
+        if key in results:
+            for f, data in results[key]['files'].items():
+                if not data.get('success', False):
+                    yield f, op, data.get('message', 'Unknown error')
+
 def print_summary(results: Dict[str, Dict[str, any]], output_dir: Path, operation: str):
     """Print a summary of the processing results."""
-    print(f"\n{BLUE}{BOLD}══════════════════════════════════════════════════════════{RESET}")
-    print(f"{CYAN}{BOLD}                      PROCESSING SUMMARY                     {RESET}")
-    print(f"{BLUE}{BOLD}══════════════════════════════════════════════════════════{RESET}")
+    lines = [
+        f"\n{SECTION_RULE}",
+        f"{CYAN}{BOLD}                      PROCESSING SUMMARY                     {RESET}",
+        SECTION_RULE,
+    ]
     
     operation_display = {
         'decrypt_and_sign_pipeline': 'Auto-detect Pipeline',
@@ -2027,106 +2619,102 @@ def print_summary(results: Dict[str, Dict[str, any]], output_dir: Path, operatio
         'decrypt_only': 'Decrypt Only'
     }
     
-    print(f"\n{BOLD}Operation:{RESET} {operation_display.get(operation, operation)}")
+    lines.append(f"\n{BOLD}Operation:{RESET} {operation_display.get(operation, operation)}")
     
     if 'detection' in results:
         detection = results['detection']
-        print(f"\n{BOLD}File Detection:{RESET}")
-        print(f"  {CYAN}SELF files: {detection['self_files']}{RESET}")
-        print(f"  {CYAN}ELF files: {detection['elf_files']}{RESET}")
-        print(f"  {CYAN}Other files: {detection['other_files']}{RESET}")
+        lines.append(f"\n{BOLD}File Detection:{RESET}")
+        lines.append(f"  {CYAN}SELF files: {detection['self_files']}{RESET}")
+        lines.append(f"  {CYAN}ELF files: {detection['elf_files']}{RESET}")
+        lines.append(f"  {CYAN}Other files: {detection['other_files']}{RESET}")
     
     if 'decrypt' in results:
         decrypt = results['decrypt']
-        print(f"\n{BOLD}Decryption Results:{RESET}")
-        print(f"  {GREEN}Successful: {decrypt['successful']}{RESET}")
-        print(f"  {RED if decrypt['failed'] > 0 else YELLOW}Failed: {decrypt['failed']}{RESET}")
-        print(f"  {CYAN}Total: {decrypt['successful'] + decrypt['failed']}{RESET}")
+        lines.append(f"\n{BOLD}Decryption Results:{RESET}")
+        lines.append(f"  {GREEN}Successful: {decrypt['successful']}{RESET}")
+        lines.append(f"  {RED if decrypt['failed'] > 0 else YELLOW}Failed: {decrypt['failed']}{RESET}")
+        lines.append(f"  {CYAN}Total: {decrypt['successful'] + decrypt['failed']}{RESET}")
         
         if 'error' in decrypt:
-            print(f"  {RED}Error: {decrypt['error']}{RESET}")
+            lines.append(f"  {RED}Error: {decrypt['error']}{RESET}")
     
     if 'downgrade' in results:
         downgrade = results['downgrade']
-        print(f"\n{BOLD}Downgrade Results:{RESET}")
-        print(f"  {GREEN}Successful: {downgrade['successful']}{RESET}")
-        print(f"  {RED if downgrade['failed'] > 0 else YELLOW}Failed: {downgrade['failed']}{RESET}")
-        print(f"  {CYAN}Total: {downgrade['successful'] + downgrade['failed']}{RESET}")
+        lines.append(f"\n{BOLD}Downgrade Results:{RESET}")
+        lines.append(f"  {GREEN}Successful: {downgrade['successful']}{RESET}")
+        lines.append(f"  {RED if downgrade['failed'] > 0 else YELLOW}Failed: {downgrade['failed']}{RESET}")
+        lines.append(f"  {CYAN}Total: {downgrade['successful'] + downgrade['failed']}{RESET}")
     
     if 'signing' in results:
         signing = results['signing']
-        print(f"\n{BOLD}Signing Results:{RESET}")
-        print(f"  {GREEN}Successful: {signing['successful']}{RESET}")
-        print(f"  {RED if signing['failed'] > 0 else YELLOW}Failed: {signing['failed']}{RESET}")
-        print(f"  {CYAN}Total: {signing['successful'] + signing['failed']}{RESET}")
+        lines.append(f"\n{BOLD}Signing Results:{RESET}")
+        lines.append(f"  {GREEN}Successful: {signing['successful']}{RESET}")
+        lines.append(f"  {RED if signing['failed'] > 0 else YELLOW}Failed: {signing['failed']}{RESET}")
+        lines.append(f"  {CYAN}Total: {signing['successful'] + signing['failed']}{RESET}")
     
     if 'libc_patch' in results:
         patch = results['libc_patch']
         if patch.get('applied', 0) > 0:
-            print(f"\n{BOLD}libc.prx Patch Results:{RESET}")
-            print(f"  {GREEN}Files patched: {patch['applied']}{RESET}")
+            lines.append(f"\n{BOLD}libc.prx Patch Results:{RESET}")
+            lines.append(f"  {GREEN}Files patched: {patch['applied']}{RESET}")
             if patch.get('results'):
-                print(f"  {CYAN}Details: {len(patch['results'])} file(s) processed{RESET}")
+                lines.append(f"  {CYAN}Details: {len(patch['results'])} file(s) processed{RESET}")
         elif patch.get('reverted', 0) > 0:
-            print(f"\n{BOLD}libc.prx Patch Results:{RESET}")
-            print(f"  {GREEN}Files reverted: {patch['reverted']}{RESET}")
+            lines.append(f"\n{BOLD}libc.prx Patch Results:{RESET}")
+            lines.append(f"  {GREEN}Files reverted: {patch['reverted']}{RESET}")
             if patch.get('results'):
-                print(f"  {CYAN}Details: {len(patch['results'])} file(s) processed{RESET}")
+                lines.append(f"  {CYAN}Details: {len(patch['results'])} file(s) processed{RESET}")
         elif 'results' in patch and patch['results']:
-            print(f"\n{BOLD}libc.prx Patch Results:{RESET}")
-            print(f"  {YELLOW}No files were patched or reverted{RESET}")
+            lines.append(f"\n{BOLD}libc.prx Patch Results:{RESET}")
+            lines.append(f"  {YELLOW}No files were patched or reverted{RESET}")
     
     if 'fakelib' in results:
         fakelib = results['fakelib']
         if fakelib.get('message'):
-            print(f"\n{BOLD}Fakelib Copy:{RESET}")
+            lines.append(f"\n{BOLD}Fakelib Copy:{RESET}")
             if fakelib.get('success', False):
-                print(f"  {GREEN}✓ {fakelib['message']}{RESET}")
+                lines.append(f"  {GREEN}✓ {fakelib['message']}{RESET}")
             else:
-                print(f"  {YELLOW}⚠ {fakelib['message']}{RESET}")
+                lines.append(f"  {YELLOW}⚠ {fakelib['message']}{RESET}")
     
     if 'fakelib_copies' in results:
         fakelib_copies = results['fakelib_copies']
         if fakelib_copies.get('created', 0) > 0:
-            print(f"\n{BOLD}Fakelib Copies to eboot.bin directories:{RESET}")
-            print(f"  {GREEN}Created: {fakelib_copies['created']} copy(ies){RESET}")
-            for i, location in enumerate(fakelib_copies.get('locations', [])[:3]):
-                print(f"  {CYAN}  • {Path(location).relative_to(Path(results.get('output_dir', '')))}{RESET}")
+            lines.append(f"\n{BOLD}Fakelib Copies to eboot.bin directories:{RESET}")
+            lines.append(f"  {GREEN}Created: {fakelib_copies['created']} copy(ies){RESET}")
+            output_root = str(results.get('output_dir') or os.curdir)
+            for location in fakelib_copies.get('locations', [])[:3]:
+                lines.append(f"  {CYAN}  • {os.path.relpath(location, output_root)}{RESET}")
             if len(fakelib_copies.get('locations', [])) > 3:
-                print(f"  {CYAN}  ... and {len(fakelib_copies['locations']) - 3} more{RESET}")
+                lines.append(f"  {CYAN}  ... and {len(fakelib_copies['locations']) - 3} more{RESET}")
     
     if 'decrypted_folder' in results and results['decrypted_folder']:
-        print(f"\n{BOLD}Decrypted Files:{RESET}")
-        print(f"  {CYAN}Saved to: {results['decrypted_folder']}{RESET}")
+        lines.append(f"\n{BOLD}Decrypted Files:{RESET}")
+        lines.append(f"  {CYAN}Saved to: {results['decrypted_folder']}{RESET}")
     
+    # Only the first 5 failures are kept; the rest are just counted in the same pass
     failed_files = []
-    
-    if 'decrypt' in results:
-        failed_files.extend([(f, 'Decryption', data.get('message', 'Unknown error'))
-                           for f, data in results['decrypt']['files'].items() 
-                           if not data.get('success', False)])
-    
-    if 'downgrade' in results:
-        failed_files.extend([(f, 'Downgrade', data.get('message', 'Unknown error'))
-                           for f, data in results['downgrade']['files'].items() 
-                           if not data.get('success', False)])
-    
-    if 'signing' in results:
-        failed_files.extend([(f, 'Signing', data.get('message', 'Unknown error'))
-                           for f, data in results['signing']['files'].items() 
-                           if not data.get('success', False)])
+    more_failed = 0
+    for failure in _iter_failed_files(results):
+        if len(failed_files) < 5:
+            failed_files.append(failure)
+        else:
+            more_failed += 1
     
     if failed_files:
-        print(f"\n{BOLD}Failed Files (first 5 shown):{RESET}")
-        for f, op, msg in failed_files[:5]:
-            filename = Path(f).name
-            print(f"  {RED}• [{op}] {filename}: {msg[:100]}{'...' if len(msg) > 100 else ''}{RESET}")
-        if len(failed_files) > 5:
-            print(f"  {YELLOW}... and {len(failed_files) - 5} more{RESET}")
-    
-    print(f"\n{BLUE}{BOLD}══════════════════════════════════════════════════════════{RESET}")
-    print(f"{GREEN}{BOLD}Processing complete! Output directory: {output_dir}{RESET}")
-    print(f"{BLUE}{BOLD}══════════════════════════════════════════════════════════{RESET}")
+        lines.append(f"\n{BOLD}Failed Files (first 5 shown):{RESET}")
+        for f, op, msg in failed_files:
+            filename = os.path.basename(f)
+            if len(msg) > 100:
+                msg = msg[:100] + '...'
+            lines.append(f"  {RED}• [{op}] {filename}: {msg}{RESET}")
+        if more_failed:
+            lines.append(f"  {YELLOW}... and {more_failed} more{RESET}")
+    
+    lines.append(f"\n{SECTION_RULE}")
+    lines.append(f"{GREEN}{BOLD}Processing complete! Output directory: {output_dir}{RESET}")
+    lines.append(SECTION_RULE)
+    print('\n'.join(lines))
 
 def run_interactive_cli():
     """Run the full interactive CLI with prompts."""
@@ -2137,44 +2725,47 @@ def run_interactive_cli():
     operation = get_operation_choice()
     input_dir = get_input_directory_with_memory(processor)
     output_dir = get_output_directory_with_memory(processor)
-    project_root = Path(__file__).parent
+    project_root = PROJECT_ROOT
+    needs_signing_config = operation in SIGNING_OPERATIONS
     
     fakelib_source = None
-    if operation in ['decrypt_and_sign_pipeline', 'downgrade_and_sign']:
+    if needs_signing_config:
         fakelib_source = get_fakelib_choice(project_root)
     
     sdk_pair = None
     paid = None
     ptype = None
     
-    if operation in ['decrypt_and_sign_pipeline', 'downgrade_and_sign']:
+    if needs_signing_config:
         sdk_pair = get_sdk_version_choice()
         paid = get_paid_choice()
         ptype = get_ptype_choice()
     
-    print(f"\n{BLUE}{BOLD}══════════════════════════════════════════════════════════{RESET}")
-    print(f"{CYAN}{BOLD}                      CONFIGURATION                         {RESET}")
-    print(f"{BLUE}{BOLD}══════════════════════════════════════════════════════════{RESET}")
-    print(f"  {BOLD}Operation:{RESET} {operation.replace('_', ' ').title()}")
-    print(f"  {BOLD}Input Directory:{RESET} {input_dir}")
-    print(f"  {BOLD}Output Directory:{RESET} {output_dir}")
+    lines = [
+        f"\n{SECTION_RULE}",
+        f"{CYAN}{BOLD}                      CONFIGURATION                         {RESET}",
+        SECTION_RULE,
+        f"  {BOLD}Operation:{RESET} {operation.replace('_', ' ').title()}",
+        f"  {BOLD}Input Directory:{RESET} {input_dir}",
+        f"  {BOLD}Output Directory:{RESET} {output_dir}",
+    ]
     
     if fakelib_source:
-        print(f"  {BOLD}Fakelib Source:{RESET} {fakelib_source}")
+        lines.append(f"  {BOLD}Fakelib Source:{RESET} {fakelib_source}")
     else:
-        print(f"  {BOLD}Fakelib Source:{RESET} None (will skip)")
+        lines.append(f"  {BOLD}Fakelib Source:{RESET} None (will skip)")
     
-    if operation in ['decrypt_and_sign_pipeline', 'downgrade_and_sign']:
-        pairs = SDKVersionPatcher.get_supported_pairs()
-        ps5_sdk_version, ps4_version = pairs[sdk_pair]
-        print(f"  {BOLD}SDK Version Pair:{RESET} {sdk_pair} (PS5: 0x{ps5_sdk_version:08X}, PS4: 0x{ps4_version:08X})")
-        print(f"  {BOLD}PAID:{RESET} 0x{paid:016X}")
-        print(f"  {BOLD}PType:{RESET} 0x{ptype:08X}")
+    if needs_signing_config:
+        ps5_sdk_version, ps4_version = processor.get_sdk_pair_info(sdk_pair)
+        lines.append(f"  {BOLD}SDK Version Pair:{RESET} {sdk_pair} (PS5: 0x{ps5_sdk_version:08X}, PS4: 0x{ps4_version:08X})")
+        lines.append(f"  {BOLD}PAID:{RESET} 0x{paid:016X}")
+        lines.append(f"  {BOLD}PType:{RESET} 0x{ptype:08X}")
         
         if sdk_pair <= 6:
-            print(f"  {YELLOW}{BOLD}Note:{RESET} SDK pair {sdk_pair} selected - will apply libc.prx patch after signing{RESET}")
+            lines.append(f"  {YELLOW}{BOLD}Note:{RESET} SDK pair {sdk_pair} selected - will apply libc.prx patch after signing{RESET}")
     
-    print(f"{BLUE}{BOLD}══════════════════════════════════════════════════════════{RESET}")
+    lines.append(SECTION_RULE)
+    print('\n'.join(lines))
     
     confirm = input(f"\n{CYAN}Proceed with processing? (y/N): {RESET}").strip().lower()
     if confirm not in ['y', 'yes']:
@@ -2226,13 +2817,7 @@ def run_interactive_cli():
         
         print_summary(results, output_dir, operation)
         
-        has_failures = any(
-            results.get(key, {}).get('failed', 0) > 0 
-            for key in ['decrypt', 'downgrade', 'signing']
-            if key in results
-        )
-        
-        if has_failures:
+        if results.get('failed_total', 0) > 0:
             print(f"\n{YELLOW}Warning: Some files failed to process{RESET}")
             sys.exit(1)
         else:
@@ -2250,13 +2835,18 @@ def run_interactive_cli():
 
 
 # Utility functions for common operations
+@functools.lru_cache(maxsize=2)
+def _get_processor(use_colors: bool) -> PS5ELFProcessor:
+    """Return the processor shared by the convenience functions, one per color setting."""
+    return PS5ELFProcessor(use_colors=use_colors)
+
+
 def decrypt_file(
     input_file: Union[str, Path],
     output_file: Union[str, Path],
     verbose: bool = False
 ) -> bool:
     """Convenience function to decrypt a single SELF file."""
-    processor = PS5ELFProcessor(use_colors=False)
     converter = UnsignedELFConverter(verbose=verbose)
     return converter.convert_file(str(input_file), str(output_file))
 
@@ -2270,72 +2860,82 @@ def sign_file(
     verbose: bool = False
 ) -> bool:
     """Convenience function to sign a single ELF file."""
-    temp_dir = Path(tempfile.mkdtemp(prefix="ps5_elf_"))
+    processor = _get_processor(False)
+    result = processor._sign_single(
+        str(input_file), str(output_file), sdk_pair, paid, ptype,
+        log=print if verbose else None
+    )
     
-    try:
-        processor = PS5ELFProcessor(use_colors=False)
-        
-        temp_input = temp_dir / Path(input_file).name
-        shutil.copy2(input_file, temp_input)
-        
-        temp_output = temp_dir / "output"
-        
-        results = processor.downgrade_and_sign(
-            input_dir=temp_dir,
-            output_dir=temp_output,
-            sdk_pair=sdk_pair,
-            paid=paid,
-            ptype=ptype,
-            fakelib_source=None,
-            create_backup=False,
-            overwrite=True,
-            apply_libc_patch=False,
-            auto_revert_for_high_sdk=True,
-            verbose=verbose,
-            save_to_config=False
-        )
-        
-        if results['signing']['successful'] > 0:
-            for file_info in results['signing']['files'].values():
-                if file_info.get('success', False):
-                    output_path = file_info.get('output', '')
-                    if output_path:
-                        output_dir = Path(output_file).parent
-                        output_dir.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(output_path, output_file)
-                        return True
-        
-        return False
-        
-    finally:
-        try:
-            shutil.rmtree(temp_dir)
-        except:
-            pass
+    if verbose:
+        print(f"Signing {input_file}: {result['message']}")
+    
+    return result['success']
 
 
 def get_sdk_version_info() -> Dict[int, Tuple[int, int]]:
     """Get all supported SDK version pairs."""
-    processor = PS5ELFProcessor(use_colors=False)
+    processor = _get_processor(False)
     return processor.get_supported_sdk_pairs()
 
 
+# Project root -> fakelib path, for roots where fakelib was found
+_default_fakelib_paths: Dict[str, Path] = {}
+
+
 def get_default_fakelib_path(project_root: Optional[Union[str, Path]] = None) -> Optional[Path]:
-    """Get default fakelib path if it exists."""
-    if project_root is None:
-        project_root = Path(__file__).parent
+    """
+    Get default fakelib path if it exists.
     
-    project_root = Path(project_root)
-    fakelib_path = project_root / "fakelib"
+    Found paths are cached per project root; a missing fakelib is checked again on
+    the next call, so one added later is still picked up.
+    """
+    root = str(project_root if project_root is not None else PROJECT_ROOT)
+    fakelib_path = _default_fakelib_paths.get(root)
+    if fakelib_path is not None:
+        return fakelib_path
     
-    if fakelib_path.exists() and fakelib_path.is_dir():
+    fakelib_path = Path(root) / "fakelib"
+    if fakelib_path.is_dir():
+        _default_fakelib_paths[root] = fakelib_path
         return fakelib_path
     return None
 
 
 # CLI Interface
+def _parse_int_arg(value: str) -> int:
+    """Parse a hex (0x...) or decimal integer argument."""
+    if value.startswith('0x'):
+        return int(value, 16)
+    return int(value, 0)
+
+
+def _parse_ptype_arg(value: str) -> int:
+    """Parse a program type argument given as a number or a name (e.g. 'fake')."""
+    try:
+        return _parse_int_arg(value)
+    except ValueError:
+        if value.startswith('0x'):
+            raise
+        return FakeSignedELFConverter.parse_ptype(value.lower())
+
+
 def run_cli():
     """Command-line interface for the PS5 Backport Tool."""
+    import argparse
+    
+    # Converters for --paid/--ptype, run by parse_args so bad values fail as usage errors
+    def paid_arg(value: str) -> int:
+        try:
+            return _parse_int_arg(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError("Invalid PAID format. Use hex (0x...) or decimal")
+    
+    def ptype_arg(value: str) -> int:
+        try:
+            return _parse_ptype_arg(value)
+        except Exception as e:
+            raise argparse.ArgumentTypeError(f"Invalid ptype '{value}': {str(e)}")
+    
     parser = argparse.ArgumentParser(
         description='PS5 Backport Tool - Downgrade, fake sign, and decrypt ELF/SELF files',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2373,8 +2973,8 @@ Examples:
     parser.add_argument('--output', '-o', type=str, help='Output directory for processed files')
     parser.add_argument('--password', type=str, default=None, help='Password for encrypted archives')
     parser.add_argument('--sdk-pair', '-s', type=int, default=4, help='SDK version pair number (1-10, default: 4)')
-    parser.add_argument('--paid', type=str, default='0x3100000000000002', help='Program Authentication ID (hex, default: 0x3100000000000002)')
-    parser.add_argument('--ptype', type=str, default='fake', help='Program type (name or hex, default: "fake")')
+    parser.add_argument('--paid', type=paid_arg, default='0x3100000000000002', help='Program Authentication ID (hex, default: 0x3100000000000002)')
+    parser.add_argument('--ptype', type=ptype_arg, default='fake', help='Program type (name or hex, default: "fake")')
     parser.add_argument('--no-libc-patch', action='store_true', help='Skip libc.prx patch entirely')
     parser.add_argument('--no-auto-revert', action='store_true', help='Do not automatically revert libc patch for SDK > 6')
     parser.add_argument('--fakelib', '-f', type=str, help='Custom fakelib directory path')
@@ -2432,13 +3032,18 @@ Examples:
     
     if args.list_sdk_pairs:
         sdk_pairs = get_sdk_version_info()
-        print("Available SDK Version Pairs:")
-        print("┌──────┬──────────────────────┬──────────────────────┐")
-        print("│ Pair │ PS5 SDK Version      │ PS4 Version         │")
-        print("├──────┼──────────────────────┼──────────────────────┤")
-        for pair_num, (ps5_ver, ps4_ver) in sdk_pairs.items():
-            print(f"│ {pair_num:<4} │ 0x{ps5_ver:08X}            │ 0x{ps4_ver:08X}           │")
-        print("└──────┴──────────────────────┴──────────────────────┘")
+        table = [
+            "Available SDK Version Pairs:",
+            "┌──────┬──────────────────────┬──────────────────────┐",
+            "│ Pair │ PS5 SDK Version      │ PS4 Version         │",
+            "├──────┼──────────────────────┼──────────────────────┤",
+        ]
+        table.extend(
+            f"│ {pair_num:<4} │ 0x{ps5_ver:08X}            │ 0x{ps4_ver:08X}           │"
+            for pair_num, (ps5_ver, ps4_ver) in sdk_pairs.items()
+        )
+        table.append("└──────┴──────────────────────┴──────────────────────┘")
+        print('\n'.join(table))
         sys.exit(0)
     
     mode_was_specified = '--mode' in sys.argv or '-m' in sys.argv
@@ -2471,6 +3076,16 @@ Examples:
     processor = PS5ELFProcessor(use_colors=not args.no_colors)
     
     try:
+        # The fakelib is shared by the downgrade and auto modes
+        if args.mode in SIGNING_MODES:
+            fakelib_source = None
+            if args.fakelib:
+                fakelib_source = args.fakelib
+            else:
+                default_fakelib = get_default_fakelib_path()
+                if default_fakelib:
+                    fakelib_source = str(default_fakelib)
+        
         if args.mode == 'decrypt':
             results = processor.decrypt_files(
                 input_dir=args.input,
@@ -2480,41 +3095,12 @@ Examples:
             )
             
         elif args.mode == 'downgrade':
-            try:
-                if args.ptype.startswith('0x'):
-                    ptype = int(args.ptype, 16)
-                else:
-                    try:
-                        ptype = int(args.ptype, 0)
-                    except ValueError:
-                        ptype = processor.parse_ptype(args.ptype.lower())
-            except Exception as e:
-                print(f"Error: Invalid ptype '{args.ptype}': {str(e)}")
-                sys.exit(1)
-            
-            try:
-                if args.paid.startswith('0x'):
-                    paid = int(args.paid, 16)
-                else:
-                    paid = int(args.paid, 0)
-            except ValueError:
-                print("Error: Invalid PAID format. Use hex (0x...) or decimal")
-                sys.exit(1)
-            
-            fakelib_source = None
-            if args.fakelib:
-                fakelib_source = args.fakelib
-            else:
-                default_fakelib = get_default_fakelib_path()
-                if default_fakelib:
-                    fakelib_source = str(default_fakelib)
-            
             results = processor.downgrade_and_sign(
                 input_dir=args.input,
                 output_dir=args.output,
                 sdk_pair=args.sdk_pair,
-                paid=paid,
-                ptype=ptype,
+                paid=args.paid,
+                ptype=args.ptype,
                 fakelib_source=fakelib_source,
                 create_backup=not args.no_backup,
                 overwrite=args.overwrite,
@@ -2524,41 +3110,12 @@ Examples:
             )
             
         elif args.mode == 'auto':
-            try:
-                if args.ptype.startswith('0x'):
-                    ptype = int(args.ptype, 16)
-                else:
-                    try:
-                        ptype = int(args.ptype, 0)
-                    except ValueError:
-                        ptype = processor.parse_ptype(args.ptype.lower())
-            except Exception as e:
-                print(f"Error: Invalid ptype '{args.ptype}': {str(e)}")
-                sys.exit(1)
-            
-            try:
-                if args.paid.startswith('0x'):
-                    paid = int(args.paid, 16)
-                else:
-                    paid = int(args.paid, 0)
-            except ValueError:
-                print("Error: Invalid PAID format. Use hex (0x...) or decimal")
-                sys.exit(1)
-            
-            fakelib_source = None
-            if args.fakelib:
-                fakelib_source = args.fakelib
-            else:
-                default_fakelib = get_default_fakelib_path()
-                if default_fakelib:
-                    fakelib_source = str(default_fakelib)
-            
             results = processor.decrypt_and_sign_pipeline(
                 input_dir=args.input,
                 output_dir=args.output,
                 sdk_pair=args.sdk_pair,
-                paid=paid,
-                ptype=ptype,
+                paid=args.paid,
+                ptype=args.ptype,
                 fakelib_source=fakelib_source,
                 create_backup=not args.no_backup,
                 overwrite=args.overwrite,
@@ -2578,12 +3135,15 @@ Examples:
             
             input_path = Path(args.input)
             
-            if not input_path.exists():
+            # One stat answers both checks and is reused for the SELF magic check
+            try:
+                input_stat = os.stat(args.input)
+            except OSError:
                 print(f"Error: Input path does not exist: {args.input}")
                 sys.exit(1)
             
-            if input_path.is_file():
-                if not (processor._is_self_file(input_path) or 'libc' in input_path.name.lower()):
+            if stat.S_ISREG(input_stat.st_mode):
+                if not ('libc' in input_path.name.lower() or processor._classify_file(input_path, input_stat) == 'self'):
                     print("Warning: Input file may not be a SELF or libc file")
                     if not args.quiet:
                         confirm = input("Continue anyway? (y/N): ").strip().lower()
@@ -2640,7 +3200,7 @@ Examples:
             if 'output_dir' in results:
                 print(f"Output: {results['output_dir']}")
             
-            if args.mode in ['auto', 'downgrade']:
+            if args.mode in SIGNING_MODES:
                 print(f"\nNote: All output files are in SELF format")
                 if not args.no_libc_patch:
                     if args.sdk_pair <= 6:
@@ -2648,7 +3208,7 @@ Examples:
                     elif not args.no_auto_revert:
                         print(f"Libc.prx patch was reverted if found (SDK > 6)")
         
-        if results.get('failed', 0) > 0:
+        if results.get('failed_total', results.get('failed', 0)) > 0:
             sys.exit(1)
         else:
             sys.exit(0)
@@ -6,10 +6,10 @@
 # Added support for PS4 (0x1D3D154F) and PS5 (0xEEF51454) SELF magic                                       #
 ##############################################################################################################
 
-import sys, os, struct, traceback
+import sys, os, io, struct, traceback
 import hashlib
 import argparse
-from typing import Dict, Optional, List, BinaryIO
+from typing import Dict, Optional, List, BinaryIO, Callable
 
 def align_up(x, alignment):
     return (x + (alignment - 1)) & ~(alignment - 1)
@@ -240,6 +240,9 @@ class SelfFile(object):
         self.is_ps4_format = False
         self.is_ps5_format = False
         
+        # Receives progress and warning lines; UnsignedELFConverter sets it per file
+        self.log = print
+        
     def load(self, f: BinaryIO) -> bool:
         """Load and parse SELF file."""
         start_pos = f.tell()
@@ -268,11 +271,11 @@ class SelfFile(object):
         )
         
         if self.verbose:
-            print(f"  Detected: {'PS4' if self.is_ps4_format else 'PS5'} SELF format")
-            print(f"  Header size: 0x{self.header_size:X}")
-            print(f"  Meta size: 0x{self.meta_size:X}")
-            print(f"  File size: 0x{self.file_size:X}")
-            print(f"  Number of entries: {self.num_entries}")
+            self.log(f"  Detected: {'PS4' if self.is_ps4_format else 'PS5'} SELF format")
+            self.log(f"  Header size: 0x{self.header_size:X}")
+            self.log(f"  Meta size: 0x{self.meta_size:X}")
+            self.log(f"  File size: 0x{self.file_size:X}")
+            self.log(f"  Number of entries: {self.num_entries}")
         
         # Read entries
         self.entries = []
@@ -282,7 +285,7 @@ class SelfFile(object):
             self.entries.append(entry)
             
             if self.verbose:
-                print(f"  Entry {i}: seg_idx={entry.segment_index}, "
+                self.log(f"  Entry {i}: seg_idx={entry.segment_index}, "
                       f"has_blocks={entry.has_blocks}, has_digest={entry.has_digest}, "
                       f"offset=0x{entry.offset:X}, size=0x{entry.filesz:X}")
         
@@ -321,9 +324,9 @@ class SelfFile(object):
         self.npdrm_block.load(f)
         
         if self.verbose:
-            print(f"  Auth ID: 0x{self.ex_info.authid:016X}")
-            print(f"  Type: 0x{self.ex_info.ptype:X}")
-            print(f"  ELF segments: {self.elf_header.phnum}")
+            self.log(f"  Auth ID: 0x{self.ex_info.authid:016X}")
+            self.log(f"  Type: 0x{self.ex_info.ptype:X}")
+            self.log(f"  ELF segments: {self.elf_header.phnum}")
         
         return True
     
@@ -368,7 +371,7 @@ class SelfFile(object):
         data_entries.sort(key=lambda x: x.segment_index)
         
         if self.verbose:
-            print(f"  Found {len(data_entries)} data entries")
+            self.log(f"  Found {len(data_entries)} data entries")
         
         # Write segment data
         for data_entry in data_entries:
@@ -376,13 +379,13 @@ class SelfFile(object):
             
             if segment_idx >= len(self.program_headers):
                 if self.verbose:
-                    print(f"  Warning: Segment index {segment_idx} out of range (max {len(self.program_headers)-1})")
+                    self.log(f"  Warning: Segment index {segment_idx} out of range (max {len(self.program_headers)-1})")
                 continue
                 
             phdr = self.program_headers[segment_idx]
             
             if self.verbose:
-                print(f"  Extracting segment {segment_idx}: "
+                self.log(f"  Extracting segment {segment_idx}: "
                       f"type=0x{phdr.type:X}, offset=0x{phdr.offset:X}, "
                       f"filesz=0x{phdr.filesz:X}")
             
@@ -398,11 +401,11 @@ class SelfFile(object):
                 # Pad with zeros if needed
                 padding_size = phdr.offset - current_output_pos
                 if self.verbose and padding_size > 0:
-                    print(f"    Padding with {padding_size} bytes")
+                    self.log(f"    Padding with {padding_size} bytes")
                 output_f.write(b'\x00' * padding_size)
             elif current_output_pos > phdr.offset:
                 # This shouldn't happen, but just in case
-                print(f"Warning: Overlap detected at segment {segment_idx}")
+                self.log(f"Warning: Overlap detected at segment {segment_idx}")
                 output_f.seek(phdr.offset)
             
             output_f.write(segment_data)
@@ -412,7 +415,7 @@ class SelfFile(object):
             if current_output_pos < phdr.offset + phdr.filesz:
                 padding_size = phdr.offset + phdr.filesz - current_output_pos
                 if self.verbose and padding_size > 0:
-                    print(f"    Padding end with {padding_size} bytes")
+                    self.log(f"    Padding end with {padding_size} bytes")
                 output_f.write(b'\x00' * padding_size)
         
         # Check for PT_SCE_VERSION segment (special handling)
@@ -420,7 +423,7 @@ class SelfFile(object):
         for i, phdr in enumerate(self.program_headers):
             if phdr.type == ElfPHdr.PT_SCE_VERSION and phdr.filesz > 0:
                 if self.verbose:
-                    print(f"  Found PT_SCE_VERSION segment at index {i}")
+                    self.log(f"  Found PT_SCE_VERSION segment at index {i}")
                 
                 # Find corresponding data entry
                 for entry in data_entries:
@@ -443,7 +446,7 @@ class SelfFile(object):
                     output_f.write(version_data)
                     
                     if self.verbose:
-                        print(f"    Appended PT_SCE_VERSION from end of file")
+                        self.log(f"    Appended PT_SCE_VERSION from end of file")
         
         return True
 
@@ -462,52 +465,65 @@ class UnsignedELFConverter:
         """
         self.verbose = verbose
     
-    def convert_file(self, input_path: str, output_path: str) -> bool:
+    def convert_file(self, input_path: str, output_path: str, log: Optional[Callable[[str], None]] = None) -> bool:
         """
         Convert a single SELF file to unsigned ELF file.
         
         Args:
             input_path: Path to input SELF file
             output_path: Path to output ELF file
+            log: Receives each output line (default: print)
             
         Returns:
             bool: True if successful, False otherwise
         """
+        if log is None:
+            log = print
+        
         try:
             if self.verbose:
-                print(f"Processing: {input_path}")
+                log(f"Processing: {input_path}")
             
-            with open(input_path, 'rb') as f:
+            # Unbuffered: the magic is checked first, then the rest is read in one call
+            with open(input_path, 'rb', buffering=0) as raw:
                 # Check if it's a SELF file
-                magic = f.read(4)
-                f.seek(0)
+                magic = raw.read(4)
                 
                 is_self_file = (magic == SelfFile.SELF_PS4_MAGIC_BYTES or 
                                magic == SelfFile.SELF_PS5_MAGIC_BYTES)
                 
                 if not is_self_file:
-                    print(f"Warning: {input_path} is not a SELF file (wrong magic: 0x{magic.hex()}), skipping")
+                    log(f"Warning: {input_path} is not a SELF file (wrong magic: 0x{magic.hex()}), skipping")
                     return False
                 
-                self_file = SelfFile()
-                self_file.verbose = self.verbose
-                self_file.load(f)
-                
-                # Extract ELF
-                with open(output_path, 'wb') as out_f:
-                    f.seek(0)  # Reset to beginning
-                    success = self_file.extract_elf(f, out_f)
-                    
-                    if success and self.verbose:
-                        print(f"  Successfully extracted to: {output_path}")
-                        print(f"  Format: {'PS4' if self_file.is_ps4_format else 'PS5'}")
-                        print(f"  PAID/Auth ID: 0x{self_file.ex_info.authid:016X}")
-                        print(f"  Type: 0x{self_file.ex_info.ptype:X}")
-                    
-                    return success
+                data = magic + raw.read()
+            
+            # Parse and extract in memory; the many small header and segment
+            # reads/writes would otherwise each go through an 8 KiB file buffer
+            f = io.BytesIO(data)
+            self_file = SelfFile()
+            self_file.verbose = self.verbose
+            self_file.log = log
+            self_file.load(f)
+            
+            # Extract ELF
+            out_f = io.BytesIO()
+            f.seek(0)  # Reset to beginning
+            success = self_file.extract_elf(f, out_f)
+            
+            with open(output_path, 'wb') as out_file:
+                out_file.write(out_f.getbuffer())
+            
+            if success and self.verbose:
+                log(f"  Successfully extracted to: {output_path}")
+                log(f"  Format: {'PS4' if self_file.is_ps4_format else 'PS5'}")
+                log(f"  PAID/Auth ID: 0x{self_file.ex_info.authid:016X}")
+                log(f"  Type: 0x{self_file.ex_info.ptype:X}")
+            
+            return success
                     
         except Exception as err:
-            print(f'Error converting {input_path}: {err}')
+            log(f'Error converting {input_path}: {err}')
             if self.verbose:
                 traceback.print_exc()
             return False
@@ -6,7 +6,7 @@
 # Link to the original: https://github.com/ps5-payload-dev/sdk/blob/master/samples/install_app/make_fself.py #
 ##############################################################################################################
 
-import sys, os, struct, traceback
+import sys, os, io, struct, traceback
 import hashlib, hmac
 import argparse, re, string
 from typing import Dict, Optional, Tuple, List, Any
@@ -199,11 +199,13 @@ class ElfFile(object):
         self.ignore_shdrs = 'ignore_shdrs' in kwargs and kwargs['ignore_shdrs']
 
     def load(self, f):
-        start_offset = f.tell()
         data = f.read()
         self.file_size = len(data)
         self.digest = sha256(data)
-        f.seek(start_offset)
+
+        # Parse headers and segments from the bytes already read instead of reading the file again.
+        # The buffer starts at the ELF header, so offsets below are relative to it.
+        f = io.BytesIO(data)
 
         self.ehdr = ElfEHdr()
         self.ehdr.load(f)
@@ -215,12 +217,12 @@ class ElfFile(object):
         self.segments = []
         if self.ehdr.has_segments():
             for i in range(self.ehdr.phnum):
-                f.seek(start_offset + self.ehdr.phoff + i * self.ehdr.phentsize)
+                f.seek(self.ehdr.phoff + i * self.ehdr.phentsize)
                 phdr = ElfPHdr(i)
                 phdr.load(f)
                 self.phdrs.append(phdr)
                 if phdr.filesz > 0:
-                    f.seek(start_offset + phdr.offset)
+                    f.seek(phdr.offset)
                     data = f.read(phdr.filesz)
                 else:
                     data = b''
@@ -230,12 +232,12 @@ class ElfFile(object):
         self.sections = []
         if self.ehdr.has_sections():
             for i in range(self.ehdr.shnum):
-                f.seek(start_offset + self.ehdr.shoff + i * self.ehdr.shentsize)
+                f.seek(self.ehdr.shoff + i * self.ehdr.shentsize)
                 shdr = ElfSHdr(i)
                 shdr.load(f)
                 self.shdrs.append(shdr)
                 if shdr.size > 0 and shdr.type != 8:  # SHT_NOBITS
-                    f.seek(start_offset + shdr.offset)
+                    f.seek(shdr.offset)
                     data = f.read(shdr.size)
                 else:
                     data = b''
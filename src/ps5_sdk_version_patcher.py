@@ -11,7 +11,7 @@ import struct
 import shutil
 import argparse
 import sys
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
 # ANSI color codes
@@ -170,12 +170,13 @@ class SDKVersionPatcher:
         else:
             return "unknown"
     
-    def _patch_file_internal(self, file_path: str) -> Tuple[bool, str]:
+    def _patch_file_internal(self, file_path: str, log: Callable[[str], None]) -> Tuple[bool, str]:
         """
         Internal method to patch a single file.
         
         Args:
             file_path: Path to the ELF file
+            log: Callable receiving each patched-segment message
             
         Returns:
             Tuple of (success, message)
@@ -275,7 +276,7 @@ class SDKVersionPatcher:
                           f"PS5 SDK version 0x{og_ps5_sdk_version:08X} -> 0x{self.ps5_sdk_version:08X}, "
                           f"PS4 version 0x{og_ps4_sdk_version:08X} -> 0x{self.ps4_version:08X}")
                     patched = True
-                    print(self._colorize(f"[+] {msg}", GREEN))
+                    log(self._colorize(f"[+] {msg}", GREEN))
                 
                 if not patched:
                     msg = f"No process or module param segment found in '{file_path}'"
@@ -286,12 +287,13 @@ class SDKVersionPatcher:
         except Exception as e:
             return False, f"Error patching '{file_path}': {str(e)}"
     
-    def patch_file(self, file_path: str) -> Tuple[bool, str]:
+    def patch_file(self, file_path: str, log: Optional[Callable[[str], None]] = None) -> Tuple[bool, str]:
         """
         Patch a single ELF file.
         
         Args:
             file_path: Path to the ELF file
+            log: Callable receiving each patched-segment message (default: print)
             
         Returns:
             Tuple of (success, message)
@@ -305,7 +307,7 @@ class SDKVersionPatcher:
         if not os.path.exists(file_path):
             return False, f"File not found: '{file_path}'"
         
-        return self._patch_file_internal(file_path)
+        return self._patch_file_internal(file_path, log if log is not None else print)
     
     def patch_directory(self, directory_path: str) -> Dict[str, Tuple[bool, str]]:
         """